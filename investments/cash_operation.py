@@ -1,13 +1,49 @@
-CASH = "deposit"
-DIVIDEND = "dividend"
-FREE_FUNDS_INTEREST = "free_funds_interest"
-FREE_FUNDS_INTEREST_TAX = "free_funds_interest_tax"
-STOCK_PURCHASE = "stock_purchase"
+from enum import IntEnum
+
+
+class CashOperationType(IntEnum):
+    DEPOSIT = 0
+    DIVIDEND = 1
+    FREE_FUNDS_INTEREST = 2
+    FREE_FUNDS_INTEREST_TAX = 3
+    STOCK_PURCHASE = 4
+
+    def __str__(self):
+        return _TYPE_NAMES[self]
+
+    @staticmethod
+    def fromName(name: str) -> "CashOperationType":
+        return _TYPES_BY_NAME[name]
+
+    @staticmethod
+    def of(value) -> "CashOperationType":
+        # Accepts either a type or its public name, e.g. CASH
+        return _TYPES_BY_NAME[value] if isinstance(value, str) else value
+
+
+_TYPE_NAMES = (
+    "deposit",
+    "dividend",
+    "free_funds_interest",
+    "free_funds_interest_tax",
+    "stock_purchase",
+)
+_TYPES_BY_NAME = {name: CashOperationType(i) for i, name in enumerate(_TYPE_NAMES)}
+
+# The public constants stay the type names, the integer tags are internal
+CASH = str(CashOperationType.DEPOSIT)
+DIVIDEND = str(CashOperationType.DIVIDEND)
+FREE_FUNDS_INTEREST = str(CashOperationType.FREE_FUNDS_INTEREST)
+FREE_FUNDS_INTEREST_TAX = str(CashOperationType.FREE_FUNDS_INTEREST_TAX)
+STOCK_PURCHASE = str(CashOperationType.STOCK_PURCHASE)
 
 
 class CashOperation:
+    __slots__ = ("type", "amount", "timestamp")
+
     def __init__(self, type, amount, timestamp):
-        self.type = type
+        # Types are stored as integer tags, the string names are still accepted
+        self.type = CashOperationType.of(type)
         self.amount = amount
         self.timestamp = timestamp
 
@@ -15,7 +51,7 @@ class CashOperation:
         return self.amount
 
     def getType(self):
-        return self.type
+        return _TYPE_NAMES[self.type]
 
     def isBefore(self, timestamp):
         return self.timestamp < timestamp
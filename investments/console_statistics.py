@@ -1,11 +1,51 @@
+import sys
+from typing import Any, Dict
+
 from investments.statistics import Statistics
 
+_SECTIONS = (
+    ("deposits", "DEPOSITS"),
+    ("dividends", "DIVIDENDS"),
+    ("stock_purchases", "STOCK PURCHASES"),
+)
+
+
+def format_statistics(statistics: Dict[str, Any], skip_empty: bool = False) -> str:
+    """
+    Format statistics as the console report text.
+
+    Args:
+        statistics: Dictionary containing the statistics to format
+        skip_empty: Leave out sections without any amounts
+
+    Returns:
+        The report, one line per time period, ending with a newline
+    """
+    lines = ["=" * 60, "PORTFOLIO STATISTICS", "=" * 60]
+
+    for key, title in _SECTIONS:
+        if key not in statistics or (skip_empty and not statistics[key]):
+            continue
+
+        lines.append(f"\n{title}:")
+        lines.append("-" * 20)
+        lines.extend(
+            f"{time_period}: €{amount:,.2f}"
+            for time_period, amount in sorted(statistics[key].items())
+        )
+
+    lines.append("=" * 60)
+
+    return "\n".join(lines) + "\n"
+
 
 class ConsoleStatistics(Statistics):
     """
     Concrete implementation of Statistics for console output.
     """
 
+    __slots__ = ()
+
     def output_statistics(self, statistics: dict) -> None:
         """
         Output statistics to console with formatted display.
@@ -13,29 +53,5 @@ class ConsoleStatistics(Statistics):
         Args:
             statistics: Dictionary containing the statistics to output
         """
-        print("=" * 60)
-        print("PORTFOLIO STATISTICS")
-        print("=" * 60)
-
-        # Output deposits
-        if "deposits" in statistics and statistics["deposits"]:
-            print("\nDEPOSITS:")
-            print("-" * 20)
-            for time_period, amount in sorted(statistics["deposits"].items()):
-                print(f"{time_period}: €{amount:,.2f}")
-
-        # Output dividends
-        if "dividends" in statistics and statistics["dividends"]:
-            print("\nDIVIDENDS:")
-            print("-" * 20)
-            for time_period, amount in sorted(statistics["dividends"].items()):
-                print(f"{time_period}: €{amount:,.2f}")
-
-        # Output stock purchases
-        if "stock_purchases" in statistics and statistics["stock_purchases"]:
-            print("\nSTOCK PURCHASES:")
-            print("-" * 20)
-            for time_period, amount in sorted(statistics["stock_purchases"].items()):
-                print(f"{time_period}: €{amount:,.2f}")
-
-        print("=" * 60)
+        # A single write instead of one print per line
+        sys.stdout.write(format_statistics(statistics, skip_empty=True))
@@ -1,45 +1,59 @@
-from datetime import datetime, timedelta
+from datetime import date as _date, datetime
+from functools import lru_cache
 
 
 class Date:
+    __slots__ = ("__ordinal", "__datetime", "__string")
 
     def __init__(self, day: int, month: int, year: int):
-        self.__datetime = datetime(year=year, month=month, day=day)
+        value = datetime(year=year, month=month, day=day)
+        self.__ordinal = value.toordinal()
+        self.__datetime = value
+        self.__string = None
+
+    @staticmethod
+    def _fromOrdinal(ordinal: int) -> "Date":
+        # Day arithmetic works on the ordinal, the datetime is only built on demand
+        date = Date.__new__(Date)
+        date.__ordinal = ordinal
+        date.__datetime = None
+        date.__string = None
+        return date
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def of(day: int, month: int, year: int) -> "Date":
+        # Dates are immutable, so equal dates can share one instance
+        return Date(day, month, year)
+
+    def toDatetime(self):
+        if self.__datetime is None:
+            self.__datetime = datetime.fromordinal(self.__ordinal)
+        return self.__datetime
 
     def toString(self):
-        return self.__datetime.strftime("%Y-%m-%d")
+        if self.__string is None:
+            # "YYYY-MM-DD", formatted straight from the ordinal
+            self.__string = _date.fromordinal(self.__ordinal).isoformat()
+        return self.__string
 
     def isWeekDay(self):
-        return self.__datetime.weekday() < 5
+        return self.__weekday() < 5
 
     def isBefore(self, date: "Date"):
-        return self.__datetime < date.__datetime
+        return self.__ordinal < date.__ordinal
 
     def getLastWeekDayDate(self):
-        if self.__isSaturday():
-            one_day_ago = self.__datetime + timedelta(days=-1)
-            return Date(
-                day=one_day_ago.day, month=one_day_ago.month, year=one_day_ago.year
-            )
-
-        if self.__isSunday():
-            two_days_ago = self.__datetime + timedelta(days=-2)
-            return Date(
-                day=two_days_ago.day, month=two_days_ago.month, year=two_days_ago.year
-            )
-
-        return Date(
-            day=self.__datetime.day,
-            month=self.__datetime.month,
-            year=self.__datetime.year,
-        )
-
-    def __isSaturday(self):
-        return self.__datetime.weekday() == 5
-
-    def __isSunday(self):
-        return self.__datetime.weekday() == 6
+        weekday = self.__weekday()
+        # Saturday and Sunday go back to Friday
+        if weekday >= 5:
+            return Date._fromOrdinal(self.__ordinal + 4 - weekday)
+
+        return self
+
+    def __weekday(self):
+        # Ordinal 1, 1 January of year 1, was a Monday
+        return (self.__ordinal - 1) % 7
 
     def getNextDay(self):
-        tomorrow = self.__datetime + timedelta(days=1)
-        return Date(day=tomorrow.day, month=tomorrow.month, year=tomorrow.year)
+        return Date._fromOrdinal(self.__ordinal + 1)
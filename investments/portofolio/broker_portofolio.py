@@ -1,17 +1,26 @@
 from .portofolio import Portofolio
+from .read_only_list import ReadOnlyList
 from investments.cash_operation import (
     CashOperation,
+    CashOperationType,
     CASH,
     DIVIDEND,
     FREE_FUNDS_INTEREST,
     FREE_FUNDS_INTEREST_TAX,
     STOCK_PURCHASE,
 )
+from investments.console_statistics import format_statistics
+from investments.statistics import PeriodTotals
+from investments.date import Date
 from investments.position import Position
 from investments.ticker.yahoo_finance_ticker import YahooFinanceTicker
+from array import array
+from bisect import bisect_right
 from datetime import datetime
+import sys
 from typing import Dict, Any, List
-from collections import defaultdict
+import numpy as np
+import pandas as pd
 
 
 class BrokerPortofolio(Portofolio):
@@ -25,12 +34,82 @@ class BrokerPortofolio(Portofolio):
         self.broker_name = "Unknown"
         self.positions = {}  # Dictionary to store positions by symbol
         self.cash = 0
-        self.cashOperations = []
+        self._cash_operations = []
+        self._cash_operations_view = ReadOnlyList(self._cash_operations)
+
+        # Struct-of-arrays columns of the cash operations, the source of the
+        # summary, the frame and the running totals below
+        self._op_amounts = array("d")  # stock purchases stored as positive
+        self._op_months = array("i")  # year * 12 + month - 1
+        self._op_types = array("b")
+        # Totals per year and month, updated as each operation is recorded
+        self._period_totals = PeriodTotals()
+        # Views derived from the columns, built on query
+        self._cash_operations_frame = None
+        self._sorted_timestamps = None
+        self._cumulative_totals = None
 
     def get_broker_name(self):
         """Return the name of the broker."""
         return self.broker_name
 
+    @property
+    def cashOperations(self) -> ReadOnlyList:
+        """
+        All cash operations, in the order they were recorded.
+
+        A read-only view of the operations rather than the list itself, so it
+        cannot be appended to: operations are added with the add_* methods,
+        which keep the cash balance, the totals and the version in sync. The
+        view is not a copy and always shows the current operations.
+        """
+        return self._cash_operations_view
+
+    @property
+    def period_totals(self) -> PeriodTotals:
+        """Totals of deposits, dividends and stock purchases per year and month."""
+        return self._period_totals
+
+    @property
+    def version(self) -> int:
+        """
+        Return the number of recorded cash operations.
+
+        It changes whenever a cash operation is recorded, so readers can cache
+        data derived from the operations and convert only the new ones.
+        """
+        return len(self._cash_operations)
+
+    def _record_cash_operation(self, cash_operation: CashOperation):
+        """
+        Store a cash operation and update the cash balance.
+
+        Args:
+            cash_operation: The operation to record
+        """
+        amount = cash_operation.getAmount()
+        timestamp = cash_operation.timestamp
+
+        self._cash_operations.append(cash_operation)
+        self.cash += amount
+
+        operation_type = cash_operation.type
+        # Stock purchases are negative amounts, but are reported as positive
+        if operation_type == CashOperationType.STOCK_PURCHASE:
+            reported_amount = -amount
+        else:
+            reported_amount = amount
+        month = timestamp.year * 12 + timestamp.month - 1
+        self._op_amounts.append(reported_amount)
+        self._op_months.append(month)
+        self._op_types.append(operation_type)
+        self._period_totals.add(operation_type, month, reported_amount)
+
+        # Drop the views derived from the operations, they are rebuilt on query
+        self._cash_operations_frame = None
+        self._sorted_timestamps = None
+        self._cumulative_totals = None
+
     def add_deposit(self, amount: float, timestamp: datetime, comment: str = ""):
         """
         Add a deposit to the portfolio.
@@ -43,9 +122,7 @@ class BrokerPortofolio(Portofolio):
         if amount <= 0:
             raise ValueError("Deposit amount must be positive")
 
-        cash_operation = CashOperation(CASH, amount, timestamp)
-        self.cashOperations.append(cash_operation)
-        self.cash += amount
+        self._record_cash_operation(CashOperation(CASH, amount, timestamp))
 
     def add_dividend(
         self, amount: float, timestamp: datetime, symbol: str, comment: str = ""
@@ -63,9 +140,7 @@ class BrokerPortofolio(Portofolio):
             raise ValueError("Dividend amount must be positive")
 
         # Add to cash
-        cash_operation = CashOperation(DIVIDEND, amount, timestamp)
-        self.cashOperations.append(cash_operation)
-        self.cash += amount
+        self._record_cash_operation(CashOperation(DIVIDEND, amount, timestamp))
 
     def add_free_funds_interest(
         self, amount: float, timestamp: datetime, comment: str = ""
@@ -81,9 +156,9 @@ class BrokerPortofolio(Portofolio):
         if amount <= 0:
             raise ValueError("Free funds interest amount must be positive")
 
-        cash_operation = CashOperation(FREE_FUNDS_INTEREST, amount, timestamp)
-        self.cashOperations.append(cash_operation)
-        self.cash += amount
+        self._record_cash_operation(
+            CashOperation(FREE_FUNDS_INTEREST, amount, timestamp)
+        )
 
     def add_free_funds_interest_tax(
         self, amount: float, timestamp: datetime, comment: str = ""
@@ -101,9 +176,9 @@ class BrokerPortofolio(Portofolio):
 
         # Convert to positive for internal storage
         tax_amount = abs(amount)
-        cash_operation = CashOperation(FREE_FUNDS_INTEREST_TAX, -tax_amount, timestamp)
-        self.cashOperations.append(cash_operation)
-        self.cash -= tax_amount
+        self._record_cash_operation(
+            CashOperation(FREE_FUNDS_INTEREST_TAX, -tax_amount, timestamp)
+        )
 
     def add_stock_purchase(
         self,
@@ -138,9 +213,9 @@ class BrokerPortofolio(Portofolio):
         purchase_amount = abs(amount)
 
         # Deduct from cash
-        cash_operation = CashOperation(STOCK_PURCHASE, -purchase_amount, timestamp)
-        self.cashOperations.append(cash_operation)
-        self.cash -= purchase_amount
+        self._record_cash_operation(
+            CashOperation(STOCK_PURCHASE, -purchase_amount, timestamp)
+        )
 
         # Add or update position
         if symbol not in self.positions:
@@ -149,11 +224,24 @@ class BrokerPortofolio(Portofolio):
             self.positions[symbol] = Position(ticker)
 
         # Register the buy in the position
-        from investments.date import Date
-
-        date = Date(timestamp.day, timestamp.month, timestamp.year)
+        date = Date.of(timestamp.day, timestamp.month, timestamp.year)
         self.positions[symbol].registerBuy(date, number_of_stocks)
 
+    def operations_of_type(self, operation_type, start: int = 0) -> List[CashOperation]:
+        """
+        Return the cash operations of one type, in the order they were recorded.
+
+        Args:
+            operation_type: Cash operation type to select, e.g. CASH
+            start: Only operations recorded at or after this position are returned
+
+        Returns:
+            List of cash operations
+        """
+        types = np.frombuffer(self._op_types, dtype=np.int8)[start:]
+        indices = np.flatnonzero(types == CashOperationType.of(operation_type)) + start
+        return [self._cash_operations[i] for i in indices.tolist()]
+
     def get_positions(self) -> Dict[str, Position]:
         """Return all positions in the portfolio."""
         return self.positions
@@ -169,27 +257,102 @@ class BrokerPortofolio(Portofolio):
         Returns:
             Dict containing cash operations summary
         """
-        summary = {
+        # Counts and totals per type from the struct-of-arrays buffers
+        types = np.frombuffer(self._op_types, dtype=np.int8).astype(np.intp)
+        amounts = np.frombuffer(self._op_amounts, dtype=np.float64)
+        size = len(CashOperationType)
+        counts = np.bincount(types, minlength=size)
+        totals = np.bincount(types, weights=amounts, minlength=size)
+        # The buffers store stock purchases as positive amounts
+        purchases = CashOperationType.STOCK_PURCHASE
+        totals[purchases] = -totals[purchases]
+        # Types are listed in the order they first appear, keyed by their names
+        present, first_seen = np.unique(types, return_index=True)
+        ordered = present[np.argsort(first_seen)].tolist()
+
+        return {
             "total_cash": self.cash,
-            "total_operations": len(self.cashOperations),
-            "operations_by_type": {},
-            "operations": [],
+            "total_operations": len(self._cash_operations),
+            "operations_by_type": {
+                str(CashOperationType(op_type)): {
+                    "count": int(counts[op_type]),
+                    "total_amount": float(totals[op_type]),
+                }
+                for op_type in ordered
+            },
+            "operations": [
+                {"type": op.getType(), "amount": op.amount, "timestamp": op.timestamp}
+                for op in self._cash_operations
+            ],
         }
 
-        # Count operations by type
-        for op in self.cashOperations:
-            op_type = op.getType()
-            if op_type not in summary["operations_by_type"]:
-                summary["operations_by_type"][op_type] = {"count": 0, "total_amount": 0}
-            summary["operations_by_type"][op_type]["count"] += 1
-            summary["operations_by_type"][op_type]["total_amount"] += op.getAmount()
-
-            # Add operation details
-            summary["operations"].append(
-                {"type": op_type, "amount": op.getAmount(), "timestamp": op.timestamp}
+    def get_cash_operations_frame(self) -> pd.DataFrame:
+        """
+        Return the cash operations as a DataFrame, for groupby/pivot style analysis.
+
+        The frame is built from the struct-of-arrays buffers on first access and
+        reused until the next cash operation is recorded.
+
+        Returns:
+            DataFrame with type, amount, timestamp, year and month_key columns
+        """
+        if self._cash_operations_frame is None:
+            months = np.frombuffer(self._op_months, dtype=np.intc)
+            self._cash_operations_frame = pd.DataFrame(
+                {
+                    "type": pd.Categorical.from_codes(
+                        np.frombuffer(self._op_types, dtype=np.int8),
+                        categories=[str(t) for t in CashOperationType],
+                    ),
+                    "amount": [op.getAmount() for op in self._cash_operations],
+                    "timestamp": [op.timestamp for op in self._cash_operations],
+                    "year": months // 12,
+                    "month_key": [
+                        f"{month // 12:04d}-{month % 12 + 1:02d}" for month in months
+                    ],
+                }
             )
 
-        return summary
+        return self._cash_operations_frame
+
+    def _build_cumulative_totals(self):
+        """Sort the operations by timestamp and compute running totals per type."""
+        timestamps = [operation.timestamp for operation in self._cash_operations]
+        # Stable sort, so operations with equal timestamps keep their order
+        order = np.array(
+            sorted(range(len(timestamps)), key=timestamps.__getitem__), dtype=np.intp
+        )
+        types = np.frombuffer(self._op_types, dtype=np.int8)[order]
+        amounts = np.frombuffer(self._op_amounts, dtype=np.float64)[order]
+
+        self._sorted_timestamps = [timestamps[i] for i in order]
+        self._cumulative_totals = {
+            operation_type: [
+                0.0,
+                *np.cumsum(np.where(types == operation_type, amounts, 0.0)).tolist(),
+            ]
+            for operation_type in CashOperationType
+        }
+
+    def get_total_until(self, operation_type, timestamp: datetime) -> float:
+        """
+        Return the total amount of one operation type up to a point in time.
+
+        Amounts follow the statistics convention, stock purchases are positive.
+
+        Args:
+            operation_type: Cash operation type to sum, e.g. CASH
+            timestamp: Operations at or before this time are included
+
+        Returns:
+            The total amount
+        """
+        if self._sorted_timestamps is None:
+            self._build_cumulative_totals()
+
+        count = bisect_right(self._sorted_timestamps, timestamp)
+
+        return self._cumulative_totals[CashOperationType.of(operation_type)][count]
 
     def get_symbols(self) -> List[str]:
         """
@@ -235,28 +398,7 @@ class BrokerPortofolio(Portofolio):
         Returns:
             Dictionary containing statistics by year
         """
-        deposits_by_year = defaultdict(float)
-        dividends_by_year = defaultdict(float)
-        stock_purchases_by_year = defaultdict(float)
-
-        for operation in self.cashOperations:
-            year = operation.timestamp.year
-            operation_type = operation.getType()
-            amount = operation.getAmount()
-
-            if operation_type == CASH:
-                deposits_by_year[year] += amount
-            elif operation_type == DIVIDEND:
-                dividends_by_year[year] += amount
-            elif operation_type == STOCK_PURCHASE:
-                # Stock purchases are negative amounts, so we take absolute value
-                stock_purchases_by_year[year] += abs(amount)
-
-        return {
-            "deposits": dict(deposits_by_year),
-            "dividends": dict(dividends_by_year),
-            "stock_purchases": dict(stock_purchases_by_year),
-        }
+        return self._period_totals.by_year()
 
     def get_statistics_by_month(self) -> Dict[str, Dict[str, float]]:
         """
@@ -265,28 +407,7 @@ class BrokerPortofolio(Portofolio):
         Returns:
             Dictionary containing statistics by month
         """
-        deposits_by_month = defaultdict(float)
-        dividends_by_month = defaultdict(float)
-        stock_purchases_by_month = defaultdict(float)
-
-        for operation in self.cashOperations:
-            month_key = operation.timestamp.strftime("%Y-%m")
-            operation_type = operation.getType()
-            amount = operation.getAmount()
-
-            if operation_type == CASH:
-                deposits_by_month[month_key] += amount
-            elif operation_type == DIVIDEND:
-                dividends_by_month[month_key] += amount
-            elif operation_type == STOCK_PURCHASE:
-                # Stock purchases are negative amounts, so we take absolute value
-                stock_purchases_by_month[month_key] += abs(amount)
-
-        return {
-            "deposits": dict(deposits_by_month),
-            "dividends": dict(dividends_by_month),
-            "stock_purchases": dict(stock_purchases_by_month),
-        }
+        return self._period_totals.by_month()
 
     def output_statistics(self, statistics: Dict[str, Any]) -> None:
         """
@@ -296,29 +417,4 @@ class BrokerPortofolio(Portofolio):
         Args:
             statistics: Dictionary containing the statistics to output
         """
-        print("=" * 60)
-        print("PORTFOLIO STATISTICS")
-        print("=" * 60)
-
-        # Output deposits
-        if "deposits" in statistics:
-            print("\nDEPOSITS:")
-            print("-" * 20)
-            for time_period, amount in sorted(statistics["deposits"].items()):
-                print(f"{time_period}: €{amount:,.2f}")
-
-        # Output dividends
-        if "dividends" in statistics:
-            print("\nDIVIDENDS:")
-            print("-" * 20)
-            for time_period, amount in sorted(statistics["dividends"].items()):
-                print(f"{time_period}: €{amount:,.2f}")
-
-        # Output stock purchases
-        if "stock_purchases" in statistics:
-            print("\nSTOCK PURCHASES:")
-            print("-" * 20)
-            for time_period, amount in sorted(statistics["stock_purchases"].items()):
-                print(f"{time_period}: €{amount:,.2f}")
-
-        print("=" * 60)
+        sys.stdout.write(format_statistics(statistics))
@@ -0,0 +1,50 @@
+from collections.abc import Sequence
+from typing import Any, List
+
+
+class ReadOnlyList(Sequence):
+    """
+    Read-only view of a list owned by a portfolio.
+
+    The view does not copy the list, so len(), indexing and iteration cost what
+    they cost on the list itself, and it always shows the current contents. It
+    has no methods that change the list, the owner keeps those to itself.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: List[Any]):
+        """
+        Initialize a view of a list.
+
+        Args:
+            items: The list to expose, it is not copied
+        """
+        self._items = items
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __reversed__(self):
+        return reversed(self._items)
+
+    def __contains__(self, item) -> bool:
+        return item in self._items
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ReadOnlyList):
+            return self._items == other._items
+        if isinstance(other, (list, tuple)):
+            return self._items == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self._items)
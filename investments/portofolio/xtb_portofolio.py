@@ -1,6 +1,27 @@
+import csv
+import io
+import itertools
+import re
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+import pandas as pd
 from .broker_portofolio import BrokerPortofolio
+from .read_only_list import ReadOnlyList
+
+_EXPECTED_HEADERS = ["ID", "Type", "Time", "Comment", "Symbol", "Amount"]
+_TIME_FORMAT = "%d/%m/%Y %H:%M:%S"
+
+# Pattern to match "OPEN BUY $number @ price" or "OPEN BUY number/ignored @ price"
+# The pattern captures the number before any "/" and ignores everything after "/" until "@"
+_BUY_RE = re.compile(r"OPEN BUY \$?(\d+(?:\.\d+)?)(?:/[^\s@]*)?\s*@\s*(\d+(?:\.\d+)?)")
+
+
+@lru_cache(maxsize=4096)
+def _parse_time(time_str: str) -> datetime:
+    # Exports repeat times, e.g. an interest and its tax, so each is parsed once
+    return datetime.strptime(time_str, _TIME_FORMAT)
 
 
 class XtbPortofolio(BrokerPortofolio):
@@ -14,6 +35,39 @@ class XtbPortofolio(BrokerPortofolio):
         self.broker_name = "XTB"
         self.transactions = []
 
+    @property
+    def transactions(self) -> ReadOnlyList:
+        """
+        All transactions, in the order they were added.
+
+        A read-only view of the transactions rather than the list itself, so it
+        cannot be appended to: transactions are added with add_transaction, or
+        replaced by assigning a new list, which keeps the symbol and type
+        lookups in sync. The view is not a copy and always shows the current
+        transactions.
+        """
+        return self._transactions_view
+
+    @transactions.setter
+    def transactions(self, transactions: List[Dict[str, Any]]):
+        self._transactions = []
+        self._transactions_view = ReadOnlyList(self._transactions)
+        self._transactions_by_symbol = defaultdict(list)
+        self._transactions_by_type = defaultdict(list)
+        for transaction in transactions:
+            self.add_transaction(transaction)
+
+    def add_transaction(self, transaction: Dict[str, Any]):
+        """
+        Store a transaction and index it by symbol and type.
+
+        Args:
+            transaction: The parsed transaction data
+        """
+        self._transactions.append(transaction)
+        self._transactions_by_symbol[transaction.get("symbol")].append(transaction)
+        self._transactions_by_type[transaction.get("type")].append(transaction)
+
     @staticmethod
     def createFromCsv(csv_reader) -> "XtbPortofolio":
         """
@@ -37,7 +91,7 @@ class XtbPortofolio(BrokerPortofolio):
             raise ValueError("CSV file is empty")
 
         # Validate header
-        expected_headers = ["ID", "Type", "Time", "Comment", "Symbol", "Amount"]
+        expected_headers = _EXPECTED_HEADERS
         if header != expected_headers:
             raise ValueError(
                 f"Invalid CSV header. Expected {expected_headers}, got {header}"
@@ -54,13 +108,170 @@ class XtbPortofolio(BrokerPortofolio):
 
             # Validate and parse the row
             transaction = XtbPortofolio._parse_transaction_row(row, row_num)
-            portfolio.transactions.append(transaction)
 
             # Process the transaction based on its type
             XtbPortofolio._process_transaction(portfolio, transaction)
 
         return portfolio
 
+    @staticmethod
+    def createFromFile(path_or_buffer) -> "XtbPortofolio":
+        """
+        Create an XtbPortofolio instance from a CSV file, parsing whole columns at once.
+
+        Times and amounts are converted with vectorized pandas operations instead of
+        a strptime/float call per row. Files pandas cannot read are parsed with
+        createFromCsv instead, and rows with missing columns, which pandas pads,
+        are reported with the same column count createFromCsv gives.
+
+        Args:
+            path_or_buffer: Path to the CSV file or a file-like object
+
+        Returns:
+            XtbPortofolio: A new instance populated with data from the CSV
+
+        Raises:
+            ValueError: If the CSV format is invalid or required fields are missing
+        """
+        if hasattr(path_or_buffer, "read"):
+            text = path_or_buffer.read()
+        else:
+            with open(path_or_buffer, encoding="utf-8", newline="") as csv_file:
+                text = csv_file.read()
+
+        try:
+            # Blank lines are kept, pandas pads short rows, so both fail validation
+            frame = pd.read_csv(
+                io.StringIO(text),
+                dtype=str,
+                keep_default_na=False,
+                skip_blank_lines=False,
+            )
+        except ValueError:
+            # e.g. an empty file or a row with too many columns
+            return XtbPortofolio.createFromCsv(csv.reader(io.StringIO(text)))
+
+        def column_count(position: int) -> int:
+            # Only asked for rows failing validation, so the text is only read
+            # again on the way to an error
+            rows = csv.reader(io.StringIO(text))
+            return len(next(itertools.islice(rows, position + 1, None)))
+
+        return XtbPortofolio._create_from_frame(frame, column_count)
+
+    @staticmethod
+    def createFromDataFrame(frame: pd.DataFrame) -> "XtbPortofolio":
+        """
+        Create an XtbPortofolio instance from an already loaded XTB export.
+
+        Args:
+            frame: DataFrame with the XTB columns, all values as strings
+
+        Returns:
+            XtbPortofolio: A new instance populated with data from the frame
+
+        Raises:
+            ValueError: If the columns are not the XTB ones or a row is invalid
+        """
+        return XtbPortofolio._create_from_frame(frame)
+
+    @staticmethod
+    def _create_from_frame(
+        frame: pd.DataFrame, column_count: Optional[Callable[[int], int]] = None
+    ) -> "XtbPortofolio":
+        """
+        Create an XtbPortofolio instance from a DataFrame of the XTB columns.
+
+        Args:
+            frame: DataFrame with the XTB columns, all values as strings
+            column_count: Gives the number of columns the row at a position had
+                in the file, for rows that fail validation
+
+        Returns:
+            XtbPortofolio: A new instance populated with data from the frame
+
+        Raises:
+            ValueError: If the columns are not the XTB ones or a row is invalid
+        """
+        header = list(frame.columns)
+        if header != _EXPECTED_HEADERS:
+            raise ValueError(
+                f"Invalid CSV header. Expected {_EXPECTED_HEADERS}, got {header}"
+            )
+
+        portfolio = XtbPortofolio()
+        for transaction in XtbPortofolio._parse_transaction_frame(frame, column_count):
+            XtbPortofolio._process_transaction(portfolio, transaction)
+
+        return portfolio
+
+    @staticmethod
+    def _parse_transaction_frame(
+        frame: pd.DataFrame, column_count: Optional[Callable[[int], int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse and validate all transaction rows of a CSV DataFrame.
+
+        Args:
+            frame: DataFrame with the expected XTB columns, all as strings
+            column_count: Gives the number of columns the row at a position had
+                in the file, for rows that fail validation
+
+        Returns:
+            List of dicts containing parsed transaction data
+
+        Raises:
+            ValueError: If validation fails
+        """
+        columns = {name: frame[name].str.strip() for name in _EXPECTED_HEADERS}
+        times = pd.to_datetime(columns["Time"], format=_TIME_FORMAT, errors="coerce")
+        # Replace comma with dot for European number format
+        amounts = pd.to_numeric(
+            columns["Amount"].str.replace(",", ".", regex=False), errors="coerce"
+        )
+        valid = (columns["ID"] != "") & times.notna() & amounts.notna()
+
+        parsed_rows = zip(
+            columns["ID"],
+            columns["Type"],
+            times.array.to_pydatetime(),
+            columns["Comment"],
+            columns["Symbol"],
+            amounts,
+        )
+        raw_rows = frame.itertuples(index=False, name=None)
+
+        transactions = []
+        for row_num, (parsed_row, raw_row, is_valid) in enumerate(
+            zip(parsed_rows, raw_rows, valid), start=2
+        ):  # Start at 2 because header is row 1
+            if not is_valid:
+                if column_count is not None:
+                    count = column_count(row_num - 2)
+                    if count != len(_EXPECTED_HEADERS):
+                        raise ValueError(
+                            f"Row {row_num}: Expected {len(_EXPECTED_HEADERS)} columns, got {count}"
+                        )
+                # Let the row parser report the precise error
+                transactions.append(
+                    XtbPortofolio._parse_transaction_row(list(raw_row), row_num)
+                )
+                continue
+
+            transaction_id, transaction_type, time, comment, symbol, amount = parsed_row
+            transactions.append(
+                {
+                    "id": transaction_id,
+                    "type": transaction_type,
+                    "time": time,
+                    "comment": comment,
+                    "symbol": symbol,
+                    "amount": float(amount),
+                }
+            )
+
+        return transactions
+
     @staticmethod
     def _parse_transaction_row(row: List[str], row_num: int) -> Dict[str, Any]:
         """
@@ -76,103 +287,127 @@ class XtbPortofolio(BrokerPortofolio):
         Raises:
             ValueError: If validation fails
         """
-        transaction = {}
+        transaction_id, transaction_type, time_str, comment, symbol, amount_str = (
+            value.strip() for value in row
+        )
 
         # Parse ID (not empty, string)
-        transaction["id"] = row[0].strip()
-        if not transaction["id"]:
+        if not transaction_id:
             raise ValueError(f"Row {row_num}: ID cannot be empty")
 
-        # Parse Type (transaction type)
-        transaction["type"] = row[1].strip()
-
         # Parse Time (not empty string with format "%d/%m/%Y %H:%M:%S")
-        time_str = row[2].strip()
         if not time_str:
             raise ValueError(f"Row {row_num}: Time cannot be empty")
 
         try:
-            transaction["time"] = datetime.strptime(time_str, "%d/%m/%Y %H:%M:%S")
+            time = _parse_time(time_str)
         except ValueError as e:
             raise ValueError(
                 f"Row {row_num}: Invalid time format '{time_str}'. Expected format: 'DD/MM/YYYY HH:MM:SS'"
             ) from e
 
-        # Parse Comment (string)
-        transaction["comment"] = row[3].strip()
-
-        # Parse Symbol (string)
-        transaction["symbol"] = row[4].strip()
-
         # Parse Amount (number) - handle European format with comma as decimal separator
-        amount_str = row[5].strip()
         try:
             # Replace comma with dot for European number format
-            amount_str_normalized = amount_str.replace(",", ".")
-            transaction["amount"] = float(amount_str_normalized)
+            amount = float(amount_str.replace(",", "."))
         except ValueError as e:
             raise ValueError(
                 f"Row {row_num}: Invalid amount '{amount_str}'. Must be a number"
             ) from e
 
-        return transaction
+        return {
+            "id": transaction_id,
+            "type": transaction_type,
+            "time": time,
+            "comment": comment,
+            "symbol": symbol,
+            "amount": amount,
+        }
 
     @staticmethod
     def _process_transaction(portfolio: "XtbPortofolio", transaction: Dict[str, Any]):
         """
-        Process a transaction based on its type and call the appropriate method in BrokerPortofolio.
+        Store a transaction and process it based on its type with the matching BrokerPortofolio method.
 
         Args:
             portfolio: The portfolio instance to update
             transaction: The parsed transaction data
         """
-        transaction_type = transaction["type"]
-        amount = transaction["amount"]
-        timestamp = transaction["time"]
-        symbol = transaction["symbol"]
-        comment = transaction["comment"]
-
-        if transaction_type == "deposit":
-            if amount <= 0:
-                raise ValueError(f"Deposit amount must be positive, got {amount}")
-            portfolio.add_deposit(amount, timestamp, comment)
+        portfolio.add_transaction(transaction)
+        handler = _TRANSACTION_HANDLERS.get(transaction["type"])
 
-        elif transaction_type == "DIVIDENT":
-            if amount <= 0:
-                raise ValueError(f"Dividend amount must be positive, got {amount}")
-            portfolio.add_dividend(amount, timestamp, symbol, comment)
+        # For unknown transaction types, just store the transaction without processing
+        if handler is not None:
+            handler(portfolio, transaction)
 
-        elif transaction_type == "Free-funds Interest":
-            if amount <= 0:
-                raise ValueError(
-                    f"Free funds interest amount must be positive, got {amount}"
-                )
-            portfolio.add_free_funds_interest(amount, timestamp, comment)
-
-        elif transaction_type == "Free-funds Interest Tax":
-            if amount >= 0:
-                raise ValueError(
-                    f"Free funds interest tax amount must be negative, got {amount}"
-                )
-            portfolio.add_free_funds_interest_tax(amount, timestamp, comment)
+    @staticmethod
+    def _process_deposit(portfolio: "XtbPortofolio", transaction: Dict[str, Any]):
+        """Validate a deposit transaction and record it in the portfolio."""
+        amount = transaction["amount"]
+        if amount <= 0:
+            raise ValueError(f"Deposit amount must be positive, got {amount}")
+        portfolio.add_deposit(amount, transaction["time"], transaction["comment"])
 
-        elif transaction_type == "Stock purchase":
-            if amount >= 0:
-                raise ValueError(
-                    f"Stock purchase amount must be negative, got {amount}"
-                )
+    @staticmethod
+    def _process_dividend(portfolio: "XtbPortofolio", transaction: Dict[str, Any]):
+        """Validate a dividend transaction and record it in the portfolio."""
+        amount = transaction["amount"]
+        if amount <= 0:
+            raise ValueError(f"Dividend amount must be positive, got {amount}")
+        portfolio.add_dividend(
+            amount, transaction["time"], transaction["symbol"], transaction["comment"]
+        )
 
-            # Parse the comment to extract number of stocks and price
-            number_of_stocks, price_per_share = (
-                XtbPortofolio._parse_stock_purchase_comment(comment)
+    @staticmethod
+    def _process_free_funds_interest(
+        portfolio: "XtbPortofolio", transaction: Dict[str, Any]
+    ):
+        """Validate a free funds interest transaction and record it in the portfolio."""
+        amount = transaction["amount"]
+        if amount <= 0:
+            raise ValueError(
+                f"Free funds interest amount must be positive, got {amount}"
             )
-            portfolio.add_stock_purchase(
-                symbol, amount, timestamp, number_of_stocks, price_per_share, comment
+        portfolio.add_free_funds_interest(
+            amount, transaction["time"], transaction["comment"]
+        )
+
+    @staticmethod
+    def _process_free_funds_interest_tax(
+        portfolio: "XtbPortofolio", transaction: Dict[str, Any]
+    ):
+        """Validate a free funds interest tax transaction and record it in the portfolio."""
+        amount = transaction["amount"]
+        if amount >= 0:
+            raise ValueError(
+                f"Free funds interest tax amount must be negative, got {amount}"
             )
+        portfolio.add_free_funds_interest_tax(
+            amount, transaction["time"], transaction["comment"]
+        )
 
-        else:
-            # For unknown transaction types, just store the transaction without processing
-            pass
+    @staticmethod
+    def _process_stock_purchase(
+        portfolio: "XtbPortofolio", transaction: Dict[str, Any]
+    ):
+        """Validate a stock purchase transaction and record it in the portfolio."""
+        amount = transaction["amount"]
+        if amount >= 0:
+            raise ValueError(f"Stock purchase amount must be negative, got {amount}")
+
+        # Parse the comment to extract number of stocks and price
+        comment = transaction["comment"]
+        number_of_stocks, price_per_share = XtbPortofolio._parse_stock_purchase_comment(
+            comment
+        )
+        portfolio.add_stock_purchase(
+            transaction["symbol"],
+            amount,
+            transaction["time"],
+            number_of_stocks,
+            price_per_share,
+            comment,
+        )
 
     @staticmethod
     def _parse_stock_purchase_comment(comment: str) -> tuple[int, float]:
@@ -193,12 +428,7 @@ class XtbPortofolio(BrokerPortofolio):
         Raises:
             ValueError: If the comment format is invalid
         """
-        import re
-
-        # Pattern to match "OPEN BUY $number @ price" or "OPEN BUY number/ignored @ price"
-        # The pattern captures the number before any "/" and ignores everything after "/" until "@"
-        pattern = r"OPEN BUY \$?(\d+(?:\.\d+)?)(?:/[^\s@]*)?\s*@\s*(\d+(?:\.\d+)?)"
-        match = re.search(pattern, comment)
+        match = _BUY_RE.match(comment)
 
         if not match:
             raise ValueError(
@@ -208,7 +438,8 @@ class XtbPortofolio(BrokerPortofolio):
             )
 
         try:
-            number_of_stocks = int(float(match.group(1)))
+            stocks = match.group(1)
+            number_of_stocks = int(float(stocks)) if "." in stocks else int(stocks)
             price_per_share = float(match.group(2))
 
             if number_of_stocks <= 0:
@@ -230,15 +461,19 @@ class XtbPortofolio(BrokerPortofolio):
 
     def get_transactions(self) -> List[Dict[str, Any]]:
         """Return all transactions in the portfolio."""
-        return self.transactions
+        return list(self._transactions)
 
     def get_transactions_by_symbol(self, symbol: str) -> List[Dict[str, Any]]:
         """Return all transactions for a specific symbol."""
-        return [t for t in self.transactions if t["symbol"] == symbol]
+        return list(self._transactions_by_symbol.get(symbol, ()))
 
     def get_transactions_by_type(self, transaction_type: str) -> List[Dict[str, Any]]:
         """Return all transactions of a specific type."""
-        return [t for t in self.transactions if t["type"] == transaction_type]
+        return list(self._transactions_by_type.get(transaction_type, ()))
+
+    def get_transaction_types(self) -> List[str]:
+        """Return the transaction types in the portfolio, in the order they first appear."""
+        return list(self._transactions_by_type)
 
     def get_symbol_transactions(self, symbol: str) -> List[Dict[str, Any]]:
         """
@@ -250,4 +485,14 @@ class XtbPortofolio(BrokerPortofolio):
         Returns:
             List of transaction dictionaries
         """
-        return [t for t in self.transactions if t["symbol"] == symbol]
+        return self.get_transactions_by_symbol(symbol)
+
+
+# Handler for each XTB transaction type, looked up once per row
+_TRANSACTION_HANDLERS = {
+    "deposit": XtbPortofolio._process_deposit,
+    "DIVIDENT": XtbPortofolio._process_dividend,
+    "Free-funds Interest": XtbPortofolio._process_free_funds_interest,
+    "Free-funds Interest Tax": XtbPortofolio._process_free_funds_interest_tax,
+    "Stock purchase": XtbPortofolio._process_stock_purchase,
+}
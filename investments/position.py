@@ -1,8 +1,13 @@
+from bisect import bisect_left
+from itertools import accumulate
+from typing import List
+
 from investments.ticker.ticker import Ticker
 from investments.date import Date
 
 
 class Position:
+    __slots__ = ("_ticker", "_changes")
 
     def __init__(self, ticker: Ticker):
         self._ticker = ticker
@@ -22,21 +27,43 @@ class Position:
 
 
 class PositionChanges:
+    __slots__ = ("_dates", "_amounts", "_sorted_dates", "_cumulative_amounts")
 
     def __init__(self):
-        self._changes = []
+        # Parallel lists, in registration order
+        self._dates = []
+        self._amounts = []
+        # Dates sorted ascending and the running total of amounts (starting with
+        # the zero total before the first change), built on query
+        self._sorted_dates = None
+        self._cumulative_amounts = None
 
     def registerBuy(self, date: Date, amount: float):
-        self._changes.append({"date": date, "amount": amount})
+        self.__register(date, amount)
 
     def registerSell(self, date: Date, amount: float):
-        self._changes.append({"date": date, "amount": (-1) * amount})
+        self.__register(date, (-1) * amount)
+
+    def __register(self, date: Date, amount: float):
+        self._dates.append(date.toDatetime())
+        self._amounts.append(amount)
+        self._sorted_dates = None
+        self._cumulative_amounts = None
+
+    def __buildCumulativeAmounts(self):
+        # Stable sort, so changes on the same date keep their registration order
+        order = sorted(range(len(self._dates)), key=self._dates.__getitem__)
+        self._sorted_dates = [self._dates[i] for i in order]
+        self._cumulative_amounts = [0, *accumulate(self._amounts[i] for i in order)]
 
     def getAmountOn(self, date: Date):
-        amount = 0
+        if self._sorted_dates is None:
+            self.__buildCumulativeAmounts()
+
+        # Only changes strictly before the date are taken into account
+        count = bisect_left(self._sorted_dates, date.toDatetime())
 
-        for change in self._changes:
-            if change["date"].isBefore(date):
-                amount += change["amount"]
+        return self._cumulative_amounts[count]
 
-        return amount
+    def getAmountsOn(self, dates: List[Date]) -> List[float]:
+        return [self.getAmountOn(date) for date in dates]
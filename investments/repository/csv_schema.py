@@ -1,10 +1,58 @@
-from typing import List, Dict, Any, Type
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+# pandas dtype holding each supported column type once parsed
+_PANDAS_DTYPES = {int: "Int64", float: "float64", bool: "boolean", str: "string"}
+
+# Value of each lowercase boolean token
+_BOOL_TOKENS = {
+    **dict.fromkeys(("true", "1", "yes", "y"), True),
+    **dict.fromkeys(("false", "0", "no", "n"), False),
+}
+
+# Marks a column missing from the row in the generated row validators
+_MISSING = object()
+
+
+def _to_bool(value: Any) -> bool:
+    """Convert a boolean cell, accepting the tokens of _BOOL_TOKENS in any case."""
+    if isinstance(value, str):
+        # A single lookup gives the value, lowercase tokens are matched
+        # without building a new string
+        result = _BOOL_TOKENS.get(value)
+        if result is None:
+            result = _BOOL_TOKENS.get(value.lower())
+            if result is None:
+                raise ValueError(f"Cannot convert '{value}' to bool")
+        return result
+    # Booleans are returned as they are
+    return bool(value)
+
+
+# Conversion of the types that are not converted by calling the type itself
+_CONVERTERS: Dict[Type, Callable[[Any], Any]] = {bool: _to_bool}
 
 
 class CsvColumn:
     """Represents a column definition in a CSV schema."""
 
-    def __init__(self, name: str, column_type: Type, optional: bool = False):
+    __slots__ = (
+        "name",
+        "column_type",
+        "optional",
+        "categorical",
+        "_convert",
+        "_empty_message",
+        "_error_prefix",
+        "_error_suffix",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        column_type: Type,
+        optional: bool = False,
+        categorical: bool = False,
+    ):
         """
         Initialize a CSV column definition.
 
@@ -12,10 +60,25 @@ class CsvColumn:
             name: Column name
             column_type: Python type for the column (e.g., str, int, float, bool)
             optional: Whether the column can be empty/None
+            categorical: Whether the column holds few distinct strings, such as
+                tickers, and should be stored as integer codes
+
+        Raises:
+            ValueError: If a non string column is marked categorical
         """
+        if categorical and column_type is not str:
+            raise ValueError(f"Column '{name}': Only str columns can be categorical")
+
         self.name = name
         self.column_type = column_type
         self.optional = optional
+        self.categorical = categorical
+        # Picked once here, so validating a cell does not branch on the type
+        self._convert = _CONVERTERS.get(column_type, column_type)
+        # Error messages are formatted here, failing cells only add the value
+        self._empty_message = f"Column '{name}' is required but got empty value"
+        self._error_prefix = f"Column '{name}': Cannot convert '"
+        self._error_suffix = f"' to {column_type.__name__}: "
 
     def validate(self, value: Any) -> Any:
         """
@@ -33,29 +96,16 @@ class CsvColumn:
         if value is None or value == "":
             if self.optional:
                 return None
-            else:
-                raise ValueError(
-                    f"Column '{self.name}' is required but got empty value"
-                )
+            raise ValueError(self._empty_message)
 
         try:
-            if self.column_type == bool:
-                if isinstance(value, bool):
-                    return value
-                if isinstance(value, str):
-                    if value.lower() in ("true", "1", "yes", "y"):
-                        return True
-                    elif value.lower() in ("false", "0", "no", "n"):
-                        return False
-                    else:
-                        raise ValueError(f"Cannot convert '{value}' to bool")
-                return bool(value)
-            else:
-                return self.column_type(value)
+            return self._convert(value)
         except (ValueError, TypeError) as e:
-            raise ValueError(
-                f"Column '{self.name}': Cannot convert '{value}' to {self.column_type.__name__}: {e}"
-            )
+            raise self._conversion_error(value, e)
+
+    def _conversion_error(self, value: Any, error: Exception) -> ValueError:
+        """Build the error raised when a value cannot be converted to the column type."""
+        return ValueError(f"{self._error_prefix}{value}{self._error_suffix}{error}")
 
 
 class CsvSchema:
@@ -70,6 +120,117 @@ class CsvSchema:
         """
         self.columns = columns
         self.column_map: Dict[str, CsvColumn] = {col.name: col for col in columns}
+        self._validate_row = self._compile_row_validator()
+
+    def _compile_row_validator(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Generate a row validator specialized for the columns of this schema.
+
+        Each column gets its own straight-line checks, with the conversion call
+        inlined, instead of looping over the columns and dispatching on the
+        column type for every cell.
+
+        Returns:
+            Function validating and converting a row, as validate_row does
+        """
+        namespace = {"_MISSING": _MISSING}
+        lines = ["def validate_row(row):"]
+
+        for i, column in enumerate(self.columns):
+            namespace[f"_name{i}"] = column.name
+            lines += [
+                f"    value = row.get(_name{i}, _MISSING)",
+                "    if value is _MISSING:",
+                *self._missing_column_lines(i, column, namespace, "        "),
+                *self._conversion_lines(i, column, namespace, "elif"),
+            ]
+
+        fields = ", ".join(f"_name{i}: column{i}" for i in range(len(self.columns)))
+        lines.append(f"    return {{{fields}}}")
+
+        return self._compile("validate_row", lines, namespace)
+
+    def build_positional_validator(
+        self, header: Sequence[str]
+    ) -> Callable[[Sequence[Optional[str]]], Tuple[Any, ...]]:
+        """
+        Generate a validator for rows given as cells in the order of a header.
+
+        The validator indexes the cells by position instead of looking the
+        columns up by name, and returns the values as a tuple in schema column
+        order. Tuples of plain values are left alone by the garbage collector,
+        unlike dicts or lists, which matters when every row of a file is held.
+        It validates like validate_row validates the row keyed by the header,
+        including the errors raised.
+
+        Args:
+            header: Column names of the file, in file order
+
+        Returns:
+            Function validating and converting the cells of a row, which must
+            have one cell per header name, None for cells the row lacks
+        """
+        # Like a dict built from the row, the last of duplicate names wins
+        positions = {name: position for position, name in enumerate(header)}
+        namespace = {}
+        lines = ["def validate_cells(cells):"]
+
+        for i, column in enumerate(self.columns):
+            position = positions.get(column.name)
+            if position is None:
+                lines += self._missing_column_lines(i, column, namespace, "    ")
+            else:
+                lines += [
+                    f"    value = cells[{position}]",
+                    *self._conversion_lines(i, column, namespace, "if"),
+                ]
+
+        fields = "".join(f"column{i}, " for i in range(len(self.columns)))
+        lines.append(f"    return ({fields})")
+
+        return self._compile("validate_cells", lines, namespace)
+
+    @staticmethod
+    def _missing_column_lines(
+        i: int, column: CsvColumn, namespace: Dict[str, Any], indent: str
+    ) -> List[str]:
+        """Generate the code handling a column missing from the row."""
+        if column.optional:
+            return [f"{indent}column{i} = None"]
+
+        namespace[f"_missing{i}"] = (
+            f"Required column '{column.name}' is missing from row"
+        )
+        return [f"{indent}raise ValueError(_missing{i})"]
+
+    @staticmethod
+    def _conversion_lines(
+        i: int, column: CsvColumn, namespace: Dict[str, Any], keyword: str
+    ) -> List[str]:
+        """Generate the code converting the cell in value, starting with an if or elif."""
+        lines = [f'    {keyword} value is None or value == "":']
+        if column.optional:
+            lines.append(f"        column{i} = None")
+        else:
+            namespace[f"_empty{i}"] = column._empty_message
+            lines.append(f"        raise ValueError(_empty{i})")
+
+        namespace[f"_convert{i}"] = column._convert
+        namespace[f"_error{i}"] = column._conversion_error
+        return lines + [
+            "    else:",
+            "        try:",
+            f"            column{i} = _convert{i}(value)",
+            "        except (ValueError, TypeError) as e:",
+            f"            raise _error{i}(value, e)",
+        ]
+
+    @staticmethod
+    def _compile(name: str, lines: List[str], namespace: Dict[str, Any]) -> Callable:
+        """Compile generated source and return the function it defines."""
+        exec(compile("\n".join(lines), "<csv schema>", "exec"), namespace)
+
+        return namespace[name]
 
     def validate_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -84,20 +245,28 @@ class CsvSchema:
         Raises:
             ValueError: If validation fails
         """
-        validated_row = {}
+        return self._validate_row(row)
 
-        # Validate each column in the schema
+    def to_pandas_dtypes(self) -> Dict[str, str]:
+        """
+        Get the pandas dtype for each column in the schema.
+
+        Returns:
+            Dictionary mapping column names to pandas dtype names
+
+        Raises:
+            ValueError: If a column type has no pandas equivalent
+        """
+        dtypes = {}
         for column in self.columns:
-            if column.name not in row:
-                if not column.optional:
-                    raise ValueError(
-                        f"Required column '{column.name}' is missing from row"
-                    )
-                validated_row[column.name] = None
-            else:
-                validated_row[column.name] = column.validate(row[column.name])
+            dtype = _PANDAS_DTYPES.get(column.column_type)
+            if dtype is None:
+                raise ValueError(
+                    f"Column '{column.name}': No pandas dtype for {column.column_type.__name__}"
+                )
+            dtypes[column.name] = dtype
 
-        return validated_row
+        return dtypes
 
     def get_column_names(self) -> List[str]:
         """Get the list of column names in the schema."""
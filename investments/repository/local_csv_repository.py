@@ -1,46 +1,661 @@
 import csv
-from typing import Any, Dict, List, Optional
+import io
+import mmap
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
 from investments.repository.repository import Repository
 from investments.repository.csv_schema import CsvSchema
 
+# Tokens of boolean cells, in lowercase, as CsvColumn.validate accepts them
+_TRUE_TOKENS = ["true", "1", "yes", "y"]
+_FALSE_TOKENS = ["false", "0", "no", "n"]
+# Digits an integer may have for the array parser, so it cannot overflow int64
+_MAX_INTEGER_DIGITS = 18
+# Buffer size of the file handle create appends rows through
+_WRITE_BUFFER_SIZE = 1 << 20
+# Bytes each thread parses at least, smaller files are parsed by one thread
+_PARALLEL_CHUNK_BYTES = 16 << 20
+# Share of distinct values under which the cells of a string column share
+# one string object per value
+_SHARED_STRINGS_MAX_RATIO = 0.05
+
+
+# numpy dtype holding each column type, other types are kept as Python objects
+_NUMPY_DTYPES = {int: np.int64, float: np.float64, bool: np.bool_}
+
+
+def _object_array(values: List[Any]) -> np.ndarray:
+    """Build a one dimensional object array, even from sequence values."""
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _column_arrays(
+    values: List[Any], column_type: type
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the value and missing arrays of a column from validated values.
+
+    Args:
+        values: Validated values, None marking missing values
+        column_type: Python type of the column
+
+    Returns:
+        Tuple of (values, missing), missing cells hold a placeholder value
+    """
+    missing = np.fromiter(
+        (value is None for value in values), dtype=bool, count=len(values)
+    )
+    dtype = _NUMPY_DTYPES.get(column_type)
+
+    if dtype is not None:
+        placeholder = np.nan if dtype is np.float64 else 0
+        try:
+            return (
+                np.array(
+                    [placeholder if value is None else value for value in values],
+                    dtype=dtype,
+                ),
+                missing,
+            )
+        except (TypeError, ValueError, OverflowError):
+            # e.g. integers beyond 64 bits
+            pass
+
+    return _object_array(values), missing
+
+
+def _parse_integers(text: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Parse a column of integer strings with array operations only.
+
+    The strings are viewed as a matrix of code points, one row per cell, and
+    the digits are accumulated one character position at a time for every
+    cell at once. Only optionally signed ASCII decimals are accepted, read_csv
+    alone would also take values such as "1.0" that int() rejects.
+
+    Args:
+        text: Unicode array of the cells
+
+    Returns:
+        The int64 values, or None if a cell is not such an integer
+    """
+    stripped = np.strings.strip(text)
+    width = stripped.dtype.itemsize // 4
+    if width == 0:
+        return None
+
+    codes = stripped.view(np.uint32).reshape(len(stripped), width)
+    lengths = np.strings.str_len(stripped)
+    negative = codes[:, 0] == ord("-")
+    first_digit = (negative | (codes[:, 0] == ord("+"))).astype(np.intp)
+
+    digit_count = lengths - first_digit
+    if (digit_count <= 0).any() or (digit_count > _MAX_INTEGER_DIGITS).any():
+        return None
+
+    values = np.zeros(len(stripped), dtype=np.int64)
+    for position in range(width):
+        in_number = (position >= first_digit) & (position < lengths)
+        digits = codes[:, position].astype(np.int64) - ord("0")
+        if ((digits < 0) | (digits > 9))[in_number].any():
+            return None
+        values = np.where(in_number, values * 10 + digits, values)
+
+    return np.where(negative, -values, values)
+
+
+def _concatenate(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Concatenate two column arrays, falling back to Python objects on a dtype mismatch."""
+    if first.dtype == second.dtype:
+        return np.concatenate([first, second])
+
+    return _object_array(first.tolist() + second.tolist())
+
+
+def _split_lines(buffer: mmap.mmap) -> Optional[Iterator[List[str]]]:
+    """
+    Split a CSV file without quoting into cells, finding the line ends with numpy.
+
+    Args:
+        buffer: Memory map of the whole file
+
+    Returns:
+        Iterator over the cells of every line, empty for blank lines as
+        csv.reader gives them, or None if the file uses quotes or carriage
+        returns and needs the csv module. It does not use the buffer, which
+        can be closed
+    """
+    if buffer.find(b'"') != -1 or buffer.find(b"\r") != -1:
+        return None
+
+    newlines = np.flatnonzero(np.frombuffer(buffer, dtype=np.uint8) == 0x0A)
+    starts = np.concatenate([[0], newlines + 1]).tolist()
+    ends = newlines.tolist() + [len(buffer)]
+
+    # Lines are split into cells lazily, holding all the cell lists at once
+    # would keep the garbage collector busy
+    lines = [buffer[start:end].decode("utf-8") for start, end in zip(starts, ends)]
+    return (line.split(",") if line else [] for line in lines)
+
+
+_NO_POSITIONS = np.empty(0, dtype=np.intp)
+# Tells an index that was never built apart from a stored None
+_MISSING = object()
+
 
 class LocalCsvRepository(Repository):
     """Repository implementation for local CSV files with schema validation."""
 
-    def __init__(self, path: str, schema: CsvSchema):
+    def __init__(self, path: str, schema: CsvSchema, max_workers: Optional[int] = None):
         """
         Initialize a local CSV repository.
 
         Args:
             path: Path to the CSV file
             schema: CsvSchema object defining the expected structure
+            max_workers: Threads parsing large files in parallel, defaults to
+                the number of CPUs
         """
         self.path = path
         self.schema = schema
-        self._data: List[Dict[str, Any]] = []
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._field_names = schema.get_column_names()
+        # Struct of arrays: one value array and one missing mask per column
+        self._columns: Dict[str, np.ndarray] = {}
+        self._missing: Dict[str, np.ndarray] = {}
+        self._row_count = 0
+        # Categorical columns hold codes into their categories array, and the
+        # code of every category for translating filter values
+        self._categories: Dict[str, np.ndarray] = {}
+        self._category_codes: Dict[str, Dict[str, int]] = {}
+        # value -> row positions per column, built the first time a column is filtered
+        self._indices: Dict[str, Optional[Dict[Any, np.ndarray]]] = {}
+        self._set_rows([])
 
     def load(self) -> None:
         """
         Load data from the CSV file and validate against the schema.
 
+        The file is parsed by pandas with the schema dtypes. Files that pandas
+        cannot convert are validated row by row, which also reports the row at
+        fault.
+
         Raises:
             FileNotFoundError: If the CSV file doesn't exist
             ValueError: If validation fails for any row
         """
-        self._data = []
+        frame = self._read_frame()
+
+        if frame is None:
+            self._set_rows(self._read_rows())
+            return
+
+        self._columns = {}
+        self._missing = {}
+        for name in self.schema.get_column_names():
+            values = frame[name]
+            # "nan" is not read by pandas here, so NaN only marks empty float cells
+            self._missing[name] = values.isna().to_numpy()
+            if values.dtype == "string":
+                self._columns[name] = values.to_numpy(dtype=object, na_value=None)
+            elif values.dtype == "float64":
+                self._columns[name] = values.to_numpy()
+            else:
+                # Missing cells hold a placeholder, the mask tells them apart
+                self._columns[name] = values.to_numpy(
+                    dtype=values.dtype.numpy_dtype, na_value=0
+                )
+        self._row_count = len(frame)
+        self._indices = {}
+        self._encode_categories()
+
+    def _set_rows(self, rows: List[Tuple[Any, ...]]):
+        """Replace the stored rows with validated rows, given as tuples of values in schema column order."""
+        self._columns = {}
+        self._missing = {}
+        for i, column in enumerate(self.schema.columns):
+            self._columns[column.name], self._missing[column.name] = _column_arrays(
+                [row[i] for row in rows], column.column_type
+            )
+        self._row_count = len(rows)
+        self._indices = {}
+        self._encode_categories()
+
+    def _encode_categories(self):
+        """Replace the values of categorical columns with codes into their categories."""
+        self._categories = {}
+        self._category_codes = {}
+        for column in self.schema.columns:
+            if not column.categorical:
+                if column.column_type is str:
+                    self._share_repeated_strings(column.name)
+                continue
+            # Missing cells are None and get the code -1
+            codes, categories = pd.factorize(self._columns[column.name])
+            self._columns[column.name] = codes.astype(np.int32)
+            self._categories[column.name] = categories
+            self._category_codes[column.name] = {
+                category: code for code, category in enumerate(categories.tolist())
+            }
+
+    def _share_repeated_strings(self, column: str):
+        """
+        Make equal cells of a string column share one interned string object.
+
+        Only done when the column has few distinct values, such as tickers or
+        currencies. Each distinct value is then stored once, and filtering by a
+        literal or looking the column index up matches on identity.
+        """
+        values = self._columns[column]
+        if values.dtype != object or len(values) == 0:
+            return
+
+        codes, uniques = pd.factorize(values)
+        if not 0 < len(uniques) <= len(values) * _SHARED_STRINGS_MAX_RATIO:
+            return
+        if not all(isinstance(value, str) for value in uniques.tolist()):
+            return
+
+        shared = _object_array([sys.intern(value) for value in uniques.tolist()])
+        values = shared.take(codes)
+        # Missing cells have the code -1
+        values[codes < 0] = None
+        self._columns[column] = values
+
+    def _append_categories(self, column: str, values: List[Any]) -> np.ndarray:
+        """Encode new values of a categorical column, adding unseen categories."""
+        category_codes = self._category_codes[column]
+        new_categories = []
+        codes = np.empty(len(values), dtype=np.int32)
+
+        for i, value in enumerate(values):
+            if value is None:
+                codes[i] = -1
+                continue
+            code = category_codes.get(value)
+            if code is None:
+                code = category_codes[value] = len(category_codes)
+                new_categories.append(value)
+            codes[i] = code
+
+        if new_categories:
+            self._categories[column] = np.concatenate(
+                [self._categories[column], _object_array(new_categories)]
+            )
+
+        return codes
+
+    def _column_dtypes(self) -> Dict[str, str]:
+        """Get the pandas dtype of each column, object for types pandas cannot hold."""
+        try:
+            return self.schema.to_pandas_dtypes()
+        except ValueError:
+            return dict.fromkeys(self.schema.get_column_names(), "object")
+
+    def _read_frame(self) -> Optional[pd.DataFrame]:
+        """
+        Read and convert the CSV file with pandas.
+
+        Returns:
+            DataFrame with one column per schema column, or None if the file
+            has to be validated row by row
+        """
+        dtypes = self._column_dtypes()
+        if "object" in dtypes.values():
+            return None
+
+        # pandas renames repeated header names, keeping the first column where
+        # the row path keeps the last, and drops a byte order mark the row path
+        # leaves in the first name
+        header = self._read_header()
+        if header and (
+            len(set(header)) != len(header) or header[0].startswith("\ufeff")
+        ):
+            return None
+
+        # Integer and boolean columns are read as text and converted below.
+        # read_csv would accept integers such as "1.0", and applies its
+        # true_values to every column, floats included
+        integer_columns = [name for name, dtype in dtypes.items() if dtype == "Int64"]
+        boolean_columns = [name for name, dtype in dtypes.items() if dtype == "boolean"]
+        read_dtypes = {
+            **dtypes,
+            **dict.fromkeys(integer_columns + boolean_columns, "string"),
+        }
+
+        try:
+            frame = self._read_csv(
+                dtype=read_dtypes,
+                usecols=lambda name: name in dtypes,
+                keep_default_na=False,
+                na_values=[""],
+                float_precision="round_trip",
+                index_col=False,
+                encoding="utf-8",
+                engine="c",
+            )
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame(columns=list(dtypes)).astype(dtypes)
+        except (ValueError, TypeError):
+            return None
+
+        if len(frame) == 0:
+            return frame.reindex(columns=list(dtypes)).astype(dtypes)
+
+        for name in integer_columns:
+            if name not in frame:
+                continue
+            missing = frame[name].isna().to_numpy()
+            values = _parse_integers(frame[name].to_numpy(dtype=str, na_value="0"))
+            if values is None:
+                return None
+            frame[name] = pd.arrays.IntegerArray(values, missing)
+
+        for name in boolean_columns:
+            if name not in frame:
+                continue
+            missing = frame[name].isna()
+            lowered = frame[name].str.lower()
+            true = lowered.isin(_TRUE_TOKENS)
+            if not (true | lowered.isin(_FALSE_TOKENS) | missing).all():
+                return None
+            frame[name] = pd.arrays.BooleanArray(
+                true.to_numpy(dtype=bool, na_value=False), missing.to_numpy()
+            )
+
+        for column in self.schema.columns:
+            if column.name not in frame:
+                if not column.optional:
+                    return None
+                frame[column.name] = pd.Series(
+                    None, index=frame.index, dtype=dtypes[column.name]
+                )
+            elif not column.optional and frame[column.name].isna().any():
+                return None
+
+        return frame[list(dtypes)]
+
+    def _read_header(self) -> Optional[List[str]]:
+        """Read the header cells of the CSV file as the row path reads them, None if the file is empty."""
+        with open(self.path, "r", encoding="utf-8", newline="") as file:
+            return next(csv.reader(file), None)
+
+    def _read_csv(self, **options) -> pd.DataFrame:
+        """
+        Parse the CSV file with pandas.read_csv.
+
+        Large files without quotes are cut at line ends into one chunk per
+        worker thread, and the chunks are parsed concurrently. The pandas C
+        parser releases the GIL while tokenizing, so the chunks are parsed
+        on several cores. Files with quotes are parsed whole, since a quoted
+        cell may span a line end.
+
+        Args:
+            **options: Options passed to pandas.read_csv
+
+        Returns:
+            The parsed DataFrame
+        """
+        chunks = self._split_chunks()
+        if chunks is None:
+            return pd.read_csv(self.path, memory_map=True, **options)
+
+        names = pd.read_csv(
+            self.path, nrows=0, index_col=False, encoding="utf-8"
+        ).columns
+
+        def read_chunk(chunk: bytes) -> pd.DataFrame:
+            return pd.read_csv(io.BytesIO(chunk), header=None, names=names, **options)
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                frames = list(executor.map(read_chunk, chunks))
+        except (ValueError, TypeError, IndexError):
+            # Chunks without a header fail differently, e.g. on rows with more
+            # cells than the header, the whole file gives the usual outcome
+            return pd.read_csv(self.path, memory_map=True, **options)
+
+        return pd.concat(frames, ignore_index=True)
+
+    def _split_chunks(self) -> Optional[List[bytes]]:
+        """
+        Cut the rows of the file, after the header, into one chunk per worker.
+
+        Returns:
+            The chunks, or None if the file should be parsed whole
+        """
+        size = os.stat(self.path).st_size
+        workers = min(self.max_workers, size // _PARALLEL_CHUNK_BYTES)
+        if workers < 2:
+            return None
+
+        with open(self.path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                header_end = buffer.find(b"\n") + 1
+                header = buffer[:header_end].rstrip(b"\r\n")
+                if buffer.find(b'"') != -1 or not header or b"\r" in header:
+                    return None
+
+                bounds = [header_end]
+                for worker in range(1, workers):
+                    line_end = buffer.find(
+                        b"\n", header_end + (size - header_end) * worker // workers
+                    )
+                    if line_end == -1:
+                        break
+                    if line_end + 1 > bounds[-1]:
+                        bounds.append(line_end + 1)
+                bounds.append(size)
+
+                return [
+                    buffer[start:end]
+                    for start, end in zip(bounds, bounds[1:])
+                    if end > start
+                ]
+
+    def _read_rows(self) -> List[Tuple[Any, ...]]:
+        """
+        Read the CSV file and validate it one row at a time.
+
+        Returns:
+            List of validated rows, as tuples of values in schema column order
+
+        Raises:
+            ValueError: If validation fails for any row
+        """
+        with open(self.path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                lines = _split_lines(buffer)
+
+        if lines is not None:
+            return list(self._validate_lines(lines))
 
         with open(self.path, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
+            return list(self._validate_lines(csv.reader(file)))
 
-            for row_num, row in enumerate(
-                reader, start=2
-            ):  # Start at 2 (header is line 1)
+    def _validate_lines(self, lines: Iterator[List[str]]) -> Iterator[Tuple[Any, ...]]:
+        """
+        Validate the cells of each line with a validator built for the header.
+
+        Rows are read like csv.DictReader reads them: the first line is the
+        header, blank lines are skipped, and short rows are padded with None.
+        The header is matched against the schema once, for all the rows.
+
+        Args:
+            lines: Cells of each line, as csv.reader gives them
+
+        Returns:
+            Iterator over the validated rows, as tuples of values in schema column order
+
+        Raises:
+            ValueError: If validation fails for a row, once the row is reached
+        """
+        header = next(lines, None)
+        if header is None:
+            return
+        validate_cells = self.schema.build_positional_validator(header)
+        width = len(header)
+
+        for row_num, cells in enumerate(
+            filter(None, lines), start=2
+        ):  # Start at 2 (header is line 1)
+            if len(cells) != width:
+                cells = cells[:width] + [None] * (width - len(cells))
+            try:
+                yield validate_cells(cells)
+            except ValueError as e:
+                raise ValueError(f"Validation error at row {row_num}: {e}")
+
+    def _rows_at(self, positions: np.ndarray) -> List[Dict[str, Any]]:
+        """Build row dictionaries for the given row positions only."""
+        names = self.schema.get_column_names()
+        columns = []
+        for name in names:
+            cells = self._columns[name][positions]
+            categories = self._categories.get(name)
+            if categories is not None and len(categories):
+                # Missing cells have the code -1, they are set to None below
+                cells = categories.take(cells, mode="clip")
+            cells = cells.tolist()
+            for i in np.flatnonzero(self._missing[name][positions]).tolist():
+                cells[i] = None
+            columns.append(cells)
+
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+    def _row_at(self, position: int) -> Dict[str, Any]:
+        """Build the row dictionary at one position, reading its cells directly."""
+        row = {}
+        for name in self._field_names:
+            if self._missing[name][position]:
+                row[name] = None
+                continue
+            cell = self._columns[name][position]
+            categories = self._categories.get(name)
+            if categories is not None:
+                cell = categories[cell]
+            # Same Python values as tolist gives in _rows_at
+            row[name] = cell.item() if isinstance(cell, np.generic) else cell
+
+        return row
+
+    def _get_index(self, column: str) -> Optional[Dict[Any, np.ndarray]]:
+        """
+        Get the value to row positions index of a column, building it on first use.
+
+        Missing cells are indexed under None.
+
+        Args:
+            column: Name of the column
+
+        Returns:
+            The index, or None if the column holds unhashable values
+        """
+        index = self._indices.get(column, _MISSING)
+        if index is not _MISSING:
+            return index
+
+        positions_by_value = defaultdict(list)
+        cells = self._columns[column].tolist()
+        missing = self._missing[column].tolist()
+        try:
+            for position, (cell, is_missing) in enumerate(zip(cells, missing)):
+                positions_by_value[None if is_missing else cell].append(position)
+        except TypeError:
+            index = None
+        else:
+            index = {
+                value: np.array(positions, dtype=np.intp)
+                for value, positions in positions_by_value.items()
+            }
+
+        self._indices[column] = index
+        return index
+
+    def _matching_positions(self, filters: Dict[str, Any]) -> np.ndarray:
+        """
+        Find the rows matching every filter.
+
+        The indexed filter with the fewest hits gives the candidate rows, the
+        other filters are only checked on those candidates.
+
+        Args:
+            filters: Column name and value pairs to filter by
+
+        Returns:
+            Positions of the matching rows, in file order
+        """
+        candidates = None
+        candidate_column = None
+        checks = []
+
+        for column, value in filters.items():
+            values = self._columns.get(column)
+            if values is None:
+                return np.empty(0, dtype=np.intp)
+
+            category_codes = self._category_codes.get(column)
+            if category_codes is not None and value is not None:
+                # Filter categorical columns by code, values that are not a
+                # category cannot match
                 try:
-                    validated_row = self.schema.validate_row(row)
-                    self._data.append(validated_row)
-                except ValueError as e:
-                    raise ValueError(f"Validation error at row {row_num}: {e}")
+                    value = category_codes.get(value)
+                except TypeError:
+                    value = None
+                if value is None:
+                    return np.empty(0, dtype=np.intp)
+            checks.append((column, values, self._missing[column], value))
+
+            index = self._get_index(column)
+            try:
+                hits = None if index is None else index.get(value, _NO_POSITIONS)
+            except TypeError:
+                # Unhashable filter values are compared cell by cell
+                hits = None
+
+            if hits is not None and (candidates is None or len(hits) < len(candidates)):
+                candidates = hits
+                candidate_column = column
+
+        if candidates is None:
+            candidates = np.arange(self._row_count)
+
+        for column, values, missing, value in checks:
+            if column == candidate_column or len(candidates) == 0:
+                continue
+            candidates = candidates[
+                self._cells_equal(values[candidates], missing[candidates], value)
+            ]
+
+        return candidates
+
+    @staticmethod
+    def _cells_equal(values: np.ndarray, missing: np.ndarray, value: Any) -> np.ndarray:
+        """Return a boolean mask of the cells equal to value, None matching missing cells."""
+        if value is None:
+            return missing.copy()
+
+        if isinstance(value, (str, int, float, np.number)):
+            equal = np.asarray(values == value, dtype=bool)
+        else:
+            # Cells are compared with the same != test as a plain loop would use
+            equal = np.fromiter(
+                (not (cell != value) for cell in values.tolist()),
+                dtype=bool,
+                count=len(values),
+            )
+
+        return equal & ~missing
 
     def find(self, **filters) -> Optional[Dict[str, Any]]:
         """
@@ -53,17 +668,11 @@ class LocalCsvRepository(Repository):
         Returns:
             A dictionary representing the first matching row, or None if no match found
         """
-        for row in self._data:
-            match = True
-            for column, value in filters.items():
-                if column not in row or row[column] != value:
-                    match = False
-                    break
+        positions = self._matching_positions(filters)
+        if len(positions) == 0:
+            return None
 
-            if match:
-                return row
-
-        return None
+        return self._row_at(positions[0])
 
     def find_all(self, **filters) -> List[Dict[str, Any]]:
         """
@@ -75,19 +684,40 @@ class LocalCsvRepository(Repository):
         Returns:
             A list of dictionaries representing all matching rows
         """
-        results = []
+        return self._rows_at(self._matching_positions(filters))
+
+    def stream_rows(self, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Read and validate the rows matching the given filters one at a time.
+
+        The file is read lazily and only the current row is held in memory,
+        whatever the size of the file. Rows are matched like find_all matches
+        them, and the loaded rows are neither used nor changed.
 
-        for row in self._data:
-            match = True
-            for column, value in filters.items():
-                if column not in row or row[column] != value:
-                    match = False
-                    break
+        Args:
+            **filters: Column name and value pairs to filter by
 
-            if match:
-                results.append(row)
+        Returns:
+            Iterator over the matching rows, in file order
 
-        return results
+        Raises:
+            FileNotFoundError: If the CSV file doesn't exist
+            ValueError: If validation fails for a row, once the row is reached
+        """
+        # The filters are checked on the validated values, before building the
+        # row dict, in a single call per row: a scalar target for one filter and
+        # a tuple for several. A filter on a column outside the schema matches
+        # no row
+        positions = {name: i for i, name in enumerate(self._field_names)}
+        known = all(column in positions for column in filters)
+        if filters and known:
+            getter = itemgetter(*(positions[column] for column in filters))
+            target = itemgetter(*filters)(filters)
+
+        with open(self.path, "r", encoding="utf-8") as file:
+            for values in self._validate_lines(csv.reader(file)):
+                if not filters or (known and getter(values) == target):
+                    yield dict(zip(self._field_names, values))
 
     def get_all(self) -> List[Dict[str, Any]]:
         """
@@ -96,7 +726,7 @@ class LocalCsvRepository(Repository):
         Returns:
             List of all rows in the repository
         """
-        return self._data.copy()
+        return self._rows_at(np.arange(self._row_count))
 
     def create(self, items: List[Dict[str, Any]]) -> None:
         # Validate and add to memory
@@ -106,17 +736,33 @@ class LocalCsvRepository(Repository):
             rows_to_add.append(validated_row)
 
         # Append to in-memory
-        self._data.extend(rows_to_add)
+        for column in self.schema.columns:
+            new_values = [row[column.name] for row in rows_to_add]
+            values, missing = _column_arrays(new_values, column.column_type)
+            if column.categorical:
+                values = self._append_categories(column.name, new_values)
+            self._columns[column.name] = _concatenate(
+                self._columns[column.name], values
+            )
+            self._missing[column.name] = np.concatenate(
+                [self._missing[column.name], missing]
+            )
+        self._row_count += len(rows_to_add)
+        self._indices = {}
 
         # Append to file
-        import os
-
-        file_exists = os.path.exists(self.path)
-        import csv
+        try:
+            write_header = os.stat(self.path).st_size == 0
+        except FileNotFoundError:
+            write_header = True
 
-        with open(self.path, "a", encoding="utf-8", newline="") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=self.schema.get_column_names())
-            if not file_exists or os.path.getsize(self.path) == 0:
-                writer.writeheader()
-            for row in rows_to_add:
-                writer.writerow(row)
+        # One buffered batch instead of a write per row
+        with open(
+            self.path, "a", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE
+        ) as csvfile:
+            writer = csv.writer(csvfile)
+            if write_header:
+                writer.writerow(self._field_names)
+            writer.writerows(
+                [row[name] for name in self._field_names] for row in rows_to_add
+            )
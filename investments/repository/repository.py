@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 
 class Repository(ABC):
@@ -27,6 +27,34 @@ class Repository(ABC):
         """
         pass
 
+    def find_all(self, **filters) -> List[Dict[str, Any]]:
+        """
+        Find all rows matching the given filters.
+
+        Args:
+            **filters: Column name and value pairs to filter by
+
+        Returns:
+            A list of dictionaries representing all matching rows
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not implement find_all")
+
+    def stream_rows(self, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Read the rows matching the given filters one at a time.
+
+        The default yields the loaded rows find_all returns. Repositories that
+        can read their storage lazily override it, so that only the current
+        row is held in memory.
+
+        Args:
+            **filters: Column name and value pairs to filter by
+
+        Returns:
+            Iterator over the matching rows, in storage order
+        """
+        yield from self.find_all(**filters)
+
     @abstractmethod
     def create(self, items: List[Dict[str, Any]]) -> None:
         """
@@ -1,6 +1,80 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
-from collections import defaultdict
+from typing import Any, Dict
+
+from investments.cash_operation import CashOperationType
+
+_STATISTICS = (
+    ("deposits", CashOperationType.DEPOSIT),
+    ("dividends", CashOperationType.DIVIDEND),
+    ("stock_purchases", CashOperationType.STOCK_PURCHASE),
+)
+
+
+def _month_label(month: int) -> str:
+    """Format a month numbered year * 12 + month - 1 as YYYY-MM."""
+    return f"{month // 12:04d}-{month % 12 + 1:02d}"
+
+
+class PeriodTotals:
+    """
+    Running totals of deposits, dividends and stock purchases per year and month.
+
+    Each operation updates two entries, so the totals are always up to date and
+    reading them does not go over the operations. Periods are listed in the
+    order their first operation was added.
+    """
+
+    __slots__ = ("_by_year", "_by_month")
+
+    def __init__(self):
+        self._by_year = {operation_type: {} for _, operation_type in _STATISTICS}
+        self._by_month = {operation_type: {} for _, operation_type in _STATISTICS}
+
+    def add(self, operation_type: CashOperationType, month: int, amount: float):
+        """
+        Add the amount of a cash operation to its year and month.
+
+        Args:
+            operation_type: Type of the operation, other types than the
+                reported ones are ignored
+            month: Month of the operation, numbered year * 12 + month - 1
+            amount: Amount to add, stock purchases as a positive amount
+        """
+        by_month = self._by_month.get(operation_type)
+        if by_month is None:
+            return
+
+        by_month[month] = by_month.get(month, 0.0) + amount
+        by_year = self._by_year[operation_type]
+        year = month // 12
+        by_year[year] = by_year.get(year, 0.0) + amount
+
+    def by_year(self) -> Dict[str, Dict[int, float]]:
+        """
+        Return the totals of each statistic by year.
+
+        Returns:
+            Dictionary with the totals per year of each statistic, as new dicts
+        """
+        return {
+            name: dict(self._by_year[operation_type])
+            for name, operation_type in _STATISTICS
+        }
+
+    def by_month(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return the totals of each statistic by month (YYYY-MM format).
+
+        Returns:
+            Dictionary with the totals per month of each statistic, as new dicts
+        """
+        return {
+            name: {
+                _month_label(month): total
+                for month, total in self._by_month[operation_type].items()
+            }
+            for name, operation_type in _STATISTICS
+        }
 
 
 class Statistics(ABC):
@@ -9,6 +83,8 @@ class Statistics(ABC):
     Provides methods for calculating time-based statistics and abstract output methods.
     """
 
+    __slots__ = ("portfolio",)
+
     def __init__(self, portfolio):
         """
         Initialize statistics with a portfolio.
@@ -18,6 +94,36 @@ class Statistics(ABC):
         """
         self.portfolio = portfolio
 
+    def _period_totals(self) -> PeriodTotals:
+        """
+        Return the period totals of the portfolio.
+
+        Broker portfolios keep them up to date as operations are recorded.
+        Portfolios that only expose cashOperations have theirs summed again on
+        every call.
+        """
+        totals = getattr(self.portfolio, "period_totals", None)
+        if totals is not None:
+            return totals
+
+        totals = PeriodTotals()
+        for operation in self.portfolio.cashOperations:
+            operation_type = CashOperationType.of(operation.getType())
+            timestamp = operation.timestamp
+            # Stock purchases are negative amounts, so we take absolute value
+            amount = operation.getAmount()
+            if operation_type == CashOperationType.STOCK_PURCHASE:
+                amount = abs(amount)
+            totals.add(
+                operation_type, timestamp.year * 12 + timestamp.month - 1, amount
+            )
+
+        return totals
+
+    def _statistic(self, name: str, by_month: bool) -> Dict[Any, float]:
+        totals = self._period_totals()
+        return (totals.by_month() if by_month else totals.by_year())[name]
+
     def get_deposits_by_year(self) -> Dict[int, float]:
         """
         Calculate total deposits by year.
@@ -25,14 +131,7 @@ class Statistics(ABC):
         Returns:
             Dictionary with year as key and total deposit amount as value
         """
-        deposits_by_year = defaultdict(float)
-
-        for operation in self.portfolio.cashOperations:
-            if operation.getType() == "deposit":
-                year = operation.timestamp.year
-                deposits_by_year[year] += operation.getAmount()
-
-        return dict(deposits_by_year)
+        return self._statistic("deposits", by_month=False)
 
     def get_deposits_by_month(self) -> Dict[str, float]:
         """
@@ -41,14 +140,7 @@ class Statistics(ABC):
         Returns:
             Dictionary with month as key (YYYY-MM) and total deposit amount as value
         """
-        deposits_by_month = defaultdict(float)
-
-        for operation in self.portfolio.cashOperations:
-            if operation.getType() == "deposit":
-                month_key = operation.timestamp.strftime("%Y-%m")
-                deposits_by_month[month_key] += operation.getAmount()
-
-        return dict(deposits_by_month)
+        return self._statistic("deposits", by_month=True)
 
     def get_dividends_by_year(self) -> Dict[int, float]:
         """
@@ -57,14 +149,7 @@ class Statistics(ABC):
         Returns:
             Dictionary with year as key and total dividend amount as value
         """
-        dividends_by_year = defaultdict(float)
-
-        for operation in self.portfolio.cashOperations:
-            if operation.getType() == "dividend":
-                year = operation.timestamp.year
-                dividends_by_year[year] += operation.getAmount()
-
-        return dict(dividends_by_year)
+        return self._statistic("dividends", by_month=False)
 
     def get_dividends_by_month(self) -> Dict[str, float]:
         """
@@ -73,14 +158,7 @@ class Statistics(ABC):
         Returns:
             Dictionary with month as key (YYYY-MM) and total dividend amount as value
         """
-        dividends_by_month = defaultdict(float)
-
-        for operation in self.portfolio.cashOperations:
-            if operation.getType() == "dividend":
-                month_key = operation.timestamp.strftime("%Y-%m")
-                dividends_by_month[month_key] += operation.getAmount()
-
-        return dict(dividends_by_month)
+        return self._statistic("dividends", by_month=True)
 
     def get_stock_purchases_by_year(self) -> Dict[int, float]:
         """
@@ -89,15 +167,7 @@ class Statistics(ABC):
         Returns:
             Dictionary with year as key and total purchase amount as value
         """
-        purchases_by_year = defaultdict(float)
-
-        for operation in self.portfolio.cashOperations:
-            if operation.getType() == "stock_purchase":
-                year = operation.timestamp.year
-                # Stock purchases are negative amounts, so we take absolute value
-                purchases_by_year[year] += abs(operation.getAmount())
-
-        return dict(purchases_by_year)
+        return self._statistic("stock_purchases", by_month=False)
 
     def get_stock_purchases_by_month(self) -> Dict[str, float]:
         """
@@ -106,15 +176,22 @@ class Statistics(ABC):
         Returns:
             Dictionary with month as key (YYYY-MM) and total purchase amount as value
         """
-        purchases_by_month = defaultdict(float)
+        return self._statistic("stock_purchases", by_month=True)
 
-        for operation in self.portfolio.cashOperations:
-            if operation.getType() == "stock_purchase":
-                month_key = operation.timestamp.strftime("%Y-%m")
-                # Stock purchases are negative amounts, so we take absolute value
-                purchases_by_month[month_key] += abs(operation.getAmount())
+    def get_totals(self) -> Dict[str, float]:
+        """
+        Calculate the total of each statistic across all years.
+
+        The totals are summed from the yearly totals, a few values per
+        statistic, instead of going over the operations again.
 
-        return dict(purchases_by_month)
+        Returns:
+            Dictionary with the total amount of each statistic
+        """
+        return {
+            name: sum(totals.values())
+            for name, totals in self._period_totals().by_year().items()
+        }
 
     def get_all_statistics_by_year(self) -> Dict[str, Dict[int, float]]:
         """
@@ -123,11 +200,7 @@ class Statistics(ABC):
         Returns:
             Dictionary containing all statistics by year
         """
-        return {
-            "deposits": self.get_deposits_by_year(),
-            "dividends": self.get_dividends_by_year(),
-            "stock_purchases": self.get_stock_purchases_by_year(),
-        }
+        return self._period_totals().by_year()
 
     def get_all_statistics_by_month(self) -> Dict[str, Dict[str, float]]:
         """
@@ -136,11 +209,7 @@ class Statistics(ABC):
         Returns:
             Dictionary containing all statistics by month
         """
-        return {
-            "deposits": self.get_deposits_by_month(),
-            "dividends": self.get_dividends_by_month(),
-            "stock_purchases": self.get_stock_purchases_by_month(),
-        }
+        return self._period_totals().by_month()
 
     @abstractmethod
     def output_statistics(self, statistics: Dict[str, Any]) -> None:
@@ -4,6 +4,8 @@ from investments.date import Date
 
 
 class Ticker(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def getPriceOn(self, date: Date):
         pass
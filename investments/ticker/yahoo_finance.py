@@ -1,3 +1,4 @@
+import pandas as pd
 import yfinance as yf
 from investments.repository import Repository
 from investments.ticker.ticker import Ticker
@@ -21,23 +22,20 @@ class YahooFinance:
             start=start.toString(),
             end=end.toString(),
             group_by="ticker",
+            threads=True,
         )
 
-        to_create = []
         # Save to repository: expected columns ['ticker', 'date', 'Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
-        if len(ticker_symbols) == 1:
-            ticker = ticker_symbols[0]
-            for date, row in data.iterrows():
-                row_dict = row.to_dict()
-                row_dict.update({"ticker": ticker, "date": date.strftime("%Y-%m-%d")})
-                to_create.append(row_dict)
+        if isinstance(data.columns, pd.MultiIndex):
+            # Columns grouped by ticker, reshaped to one row per date and ticker
+            frame = (
+                data.stack(level=0, future_stack=True)
+                .rename_axis(["date", "ticker"])
+                .reset_index()
+            )
         else:
-            for ticker in ticker_symbols:
-                sub_df = data[ticker]
-                for date, row in sub_df.iterrows():
-                    row_dict = row.to_dict()
-                    row_dict.update(
-                        {"ticker": ticker, "date": date.strftime("%Y-%m-%d")}
-                    )
-                    to_create.append(row_dict)
-        self.repository.create(to_create)
+            frame = data.rename_axis("date").reset_index()
+            frame["ticker"] = ticker_symbols[0]
+        frame["date"] = frame["date"].dt.strftime("%Y-%m-%d")
+
+        self.repository.create(frame.to_dict(orient="records"))
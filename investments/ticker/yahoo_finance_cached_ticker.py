@@ -1,46 +1,33 @@
-from investments.ticker.ticker import Ticker
+from investments.ticker.yahoo_finance_ticker import YahooFinanceTicker
 from investments.repository import Repository
 from investments.date import Date
-import yfinance as yf
 from typing import Optional
 
 
-class YahooFinanceCachedTicker(Ticker):
+class YahooFinanceCachedTicker(YahooFinanceTicker):
+    __slots__ = ("repository", "_price_cache")
+
     def __init__(self, ticker: str, repository: Repository):
-        self.ticker = ticker
+        super().__init__(ticker)
         self.repository = repository
-        self.yf_ticker = yf.Ticker(ticker)
+        # Resolved prices by "YYYY-MM-DD". Dates without a price are not kept,
+        # the price may be published or prefetched later
+        self._price_cache = {}
 
     def getPriceOn(self, date: Date) -> Optional[float]:
-        row = self.repository.find(ticker=self.ticker, date=date.toString())
+        date_string = date.toString()
+        price = self._price_cache.get(date_string)
+        if price is not None:
+            return price
+
+        price = self._resolve_price(date, date_string)
+        if price is not None:
+            self._price_cache[date_string] = price
+        return price
+
+    def _resolve_price(self, date: Date, date_string: str) -> Optional[float]:
+        row = self.repository.find(ticker=self.ticker, date=date_string)
         if row is not None and "price" in row:
             return row["price"]
         # Otherwise, fall back to Yahoo Finance API
-        if date.isWeekDay():
-            price = self._get_open_price_on(date)
-        else:
-            price = self._get_close_price_on(date.getLastWeekDayDate())
-        return price
-
-    def _get_open_price_on(self, date: Date) -> Optional[float]:
-        start_date = date
-        end_date = date.getNextDay()
-        history = self.yf_ticker.history(
-            start=start_date.toString(), end=end_date.toString()
-        )
-        if not history.empty:
-            return round(history.loc[start_date.toString(), "Open"], 2)
-        return None
-
-    def _get_close_price_on(self, date: Date) -> Optional[float]:
-        start_date = date
-        end_date = date.getNextDay()
-        history = self.yf_ticker.history(
-            start=start_date.toString(), end=end_date.toString()
-        )
-        if not history.empty:
-            return round(history.loc[start_date.toString(), "Close"], 2)
-        return None
-
-    def getTickerName(self) -> str:
-        return self.ticker
+        return self._get_yahoo_price(date)
@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 import yfinance as yf
 
 from investments.ticker.ticker import Ticker
@@ -5,36 +7,93 @@ from investments.date import Date
 
 
 class YahooFinanceTicker(Ticker):
+    __slots__ = ("ticker", "_yf_ticker", "_history_cache")
 
     def __init__(self, ticker: str):
         self.ticker = ticker
-        self.yf_ticker = yf.Ticker(ticker)
+        self._yf_ticker = None
+        # Daily history indexed by "YYYY-MM-DD", filled by prefetch/prefetchRange
+        self._history_cache = None
+
+    @property
+    def yf_ticker(self):
+        # Created on first use, most tickers of a portfolio are never priced
+        if self._yf_ticker is None:
+            self._yf_ticker = yf.Ticker(self.ticker)
+        return self._yf_ticker
+
+    @yf_ticker.setter
+    def yf_ticker(self, yf_ticker):
+        self._yf_ticker = yf_ticker
 
     def getPriceOn(self, date: Date):
-        if date.isWeekDay():
-            return self.__getTickerOpenPriceOn(date)
+        price = self._get_yahoo_price(date)
+        if price is None:
+            # Dates without a price are an error here, only the cached ticker
+            # reports them as None
+            raise KeyError(f"No price for {self.ticker} on {date.toString()}")
 
-        return self.__getTickerClosePriceOn(date.getLastWeekDayDate())
+        return price
 
     def getTickerName(self) -> str:
         return self.ticker
 
-    def __getTickerOpenPriceOn(self, date: Date):
-        start_date = date
-        end_date = date.getNextDay()
+    def prefetch(self, dates: List[Date]):
+        """
+        Fetch the history needed by getPriceOn for all the given dates at once.
+
+        Weekend dates are priced on the previous week day, so the range starts
+        at the week day before the earliest date.
+        """
+        if dates:
+            self.prefetchRange(
+                min(dates, key=Date.toDatetime).getLastWeekDayDate(),
+                max(dates, key=Date.toDatetime),
+            )
+
+    def prefetchRange(self, start: Date, end: Date):
+        """
+        Fetch the daily history between start and end (inclusive) in one request.
 
+        Later getPriceOn calls for dates in the range are answered from memory
+        instead of requesting a single day from Yahoo Finance each time.
+        """
         history = self.yf_ticker.history(
-            start=start_date.toString(), end=end_date.toString()
+            start=start.toString(), end=end.getNextDay().toString()
         )
+        history.index = history.index.strftime("%Y-%m-%d")
+
+        if self._history_cache is not None:
+            history = history.combine_first(self._history_cache)
+        self._history_cache = history
+
+    def _get_yahoo_price(self, date: Date) -> Optional[float]:
+        # Week days are priced at the open, weekends at the last week day close
+        if date.isWeekDay():
+            return self._get_price_on(date, "Open")
+
+        return self._get_price_on(date.getLastWeekDayDate(), "Close")
+
+    def _get_cached_price(self, date: Date, column: str) -> Optional[float]:
+        if self._history_cache is None:
+            return None
+
+        date_string = date.toString()
+        if date_string not in self._history_cache.index:
+            return None
 
-        return round(history.loc[start_date.toString(), "Open"], 2)
+        return round(self._history_cache.at[date_string, column], 2)
 
-    def __getTickerClosePriceOn(self, date: Date):
-        start_date = date
-        end_date = date.getNextDay()
+    def _get_price_on(self, date: Date, column: str) -> Optional[float]:
+        cached_price = self._get_cached_price(date, column)
+        if cached_price is not None:
+            return cached_price
 
         history = self.yf_ticker.history(
-            start=start_date.toString(), end=end_date.toString()
+            start=date.toString(), end=date.getNextDay().toString()
         )
+        if history.empty:
+            return None
 
-        return round(history.loc[start_date.toString(), "Close"], 2)
+        # The single day range holds at most one row, read it by position
+        return round(history[column].iat[0], 2)
@@ -2,7 +2,6 @@
 Test script to demonstrate statistics functionality using real XTB CSV data.
 """
 
-import csv
 from investments.portofolio import XtbPortofolio
 from investments.console_statistics import ConsoleStatistics
 
@@ -14,10 +13,8 @@ def main():
     try:
         print("Loading XTB portfolio data from CSV...")
 
-        # Open and read the CSV file
-        with open(csv_file_path, "r", encoding="utf-8") as file:
-            csv_reader = csv.reader(file)
-            portfolio = XtbPortofolio.createFromCsv(csv_reader)
+        # Parse the CSV file column by column
+        portfolio = XtbPortofolio.createFromFile(csv_file_path)
 
         print("Portfolio loaded successfully!")
         print(f"Broker: {portfolio.get_broker_name()}")
@@ -52,27 +49,21 @@ def main():
         print("ADDITIONAL INSIGHTS:")
         print("=" * 60)
 
-        # Find years with activity
-        years_with_activity = set()
-        for operation in portfolio.cashOperations:
-            years_with_activity.add(operation.timestamp.year)
+        # Find years and months with activity
+        operations = portfolio.get_cash_operations_frame()
+        years_with_activity = set(operations["year"].tolist())
+        months_with_activity = set(operations["month_key"])
 
         print(f"Years with activity: {sorted(years_with_activity)}")
-
-        # Find months with activity
-        months_with_activity = set()
-        for operation in portfolio.cashOperations:
-            month_key = operation.timestamp.strftime("%Y-%m")
-            months_with_activity.add(month_key)
-
         print(f"Months with activity: {len(months_with_activity)}")
         print(f"First activity: {min(months_with_activity)}")
         print(f"Latest activity: {max(months_with_activity)}")
 
         # Calculate totals
-        total_deposits = sum(yearly_stats.get("deposits", {}).values())
-        total_dividends = sum(yearly_stats.get("dividends", {}).values())
-        total_purchases = sum(yearly_stats.get("stock_purchases", {}).values())
+        totals = console_stats.get_totals()
+        total_deposits = totals["deposits"]
+        total_dividends = totals["dividends"]
+        total_purchases = totals["stock_purchases"]
 
         print("\nTOTALS ACROSS ALL YEARS:")
         print(f"Total deposits: €{total_deposits:,.2f}")
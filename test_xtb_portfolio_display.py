@@ -2,7 +2,9 @@
 Test script to load XTB portfolio data from CSV and display comprehensive portfolio information.
 """
 
-import csv
+import heapq
+from collections import Counter
+
 from investments.portofolio import XtbPortofolio
 
 
@@ -13,7 +15,8 @@ def format_currency(amount):
 
 def format_timestamp(timestamp):
     """Format timestamp for display."""
-    return timestamp.strftime("%Y-%m-%d %H:%M:%S")
+    # Same text as strftime("%Y-%m-%d %H:%M:%S") for the naive export times
+    return timestamp.isoformat(sep=" ", timespec="seconds")
 
 
 def display_portfolio_summary(portfolio):
@@ -51,9 +54,9 @@ def display_cash_operations(portfolio):
 
     # Recent operations (last 10)
     print("Recent Operations (last 10):")
-    recent_ops = sorted(
-        cash_summary["operations"], key=lambda x: x["timestamp"], reverse=True
-    )[:10]
+    recent_ops = heapq.nlargest(
+        10, cash_summary["operations"], key=lambda x: x["timestamp"]
+    )
     for op in recent_ops:
         print(
             f"  {format_timestamp(op['timestamp'])} | {op['type']} | {format_currency(op['amount'])}"
@@ -83,21 +86,16 @@ def display_symbols_and_transactions(portfolio):
             print(f"  Total Amount: {format_currency(total_amount)}")
 
             # Show transaction types for this symbol
-            types = {}
-            for t in transactions:
-                t_type = t["type"]
-                if t_type not in types:
-                    types[t_type] = 0
-                types[t_type] += 1
+            types = Counter(t["type"] for t in transactions)
 
             print(
                 f"  Transaction Types: {', '.join(f'{t_type}({count})' for t_type, count in types.items())}"
             )
 
             # Show recent transactions for this symbol (last 5)
-            recent_transactions = sorted(
-                transactions, key=lambda x: x["time"], reverse=True
-            )[:5]
+            recent_transactions = heapq.nlargest(
+                5, transactions, key=lambda x: x["time"]
+            )
             print("  Recent Transactions:")
             for t in recent_transactions:
                 print(
@@ -113,26 +111,16 @@ def display_transaction_types_summary(portfolio):
     print("TRANSACTION TYPES SUMMARY")
     print("-" * 40)
 
-    transactions = portfolio.get_transactions()
-    type_summary = {}
-
-    for t in transactions:
-        t_type = t["type"]
-        if t_type not in type_summary:
-            type_summary[t_type] = {"count": 0, "total_amount": 0, "symbols": set()}
-
-        type_summary[t_type]["count"] += 1
-        type_summary[t_type]["total_amount"] += t["amount"]
-        if t["symbol"]:
-            type_summary[t_type]["symbols"].add(t["symbol"])
-
-    for t_type, data in sorted(type_summary.items()):
+    for t_type in sorted(portfolio.get_transaction_types()):
+        transactions = portfolio.get_transactions_by_type(t_type)
         print(f"{t_type}:")
-        print(f"  Count: {data['count']}")
-        print(f"  Total Amount: {format_currency(data['total_amount'])}")
-        if data["symbols"]:
-            symbols_list = sorted(list(data["symbols"]))
-            print(f"  Symbols: {', '.join(symbols_list)}")
+        print(f"  Count: {len(transactions)}")
+        print(
+            f"  Total Amount: {format_currency(sum(t['amount'] for t in transactions))}"
+        )
+        symbols = {t["symbol"] for t in transactions if t["symbol"]}
+        if symbols:
+            print(f"  Symbols: {', '.join(sorted(symbols))}")
         print()
 
 
@@ -143,10 +131,8 @@ def main():
     try:
         print("Loading XTB portfolio data...")
 
-        # Open and read the CSV file
-        with open(csv_file_path, "r", encoding="utf-8") as file:
-            csv_reader = csv.reader(file)
-            portfolio = XtbPortofolio.createFromCsv(csv_reader)
+        # Parse the CSV file column by column
+        portfolio = XtbPortofolio.createFromFile(csv_file_path)
 
         print("Portfolio loaded successfully!")
         print()
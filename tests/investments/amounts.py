@@ -0,0 +1,3 @@
+def cents(amount: float) -> int:
+    """Round an amount to whole cents, so cash totals compare exactly."""
+    return round(amount * 100)
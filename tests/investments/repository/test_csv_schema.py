@@ -0,0 +1,79 @@
+import unittest
+
+from investments.repository import CsvColumn, CsvSchema
+
+
+class TestCsvColumn(unittest.TestCase):
+    def setUp(self):
+        self.column = CsvColumn("adjusted", bool)
+
+    def test_validateConvertsBooleanTokens(self):
+        for value, expected in [
+            ("yes", True),
+            ("Y", True),
+            ("1", True),
+            ("FALSE", False),
+            ("n", False),
+        ]:
+            with self.subTest(value=value):
+                self.assertIs(self.column.validate(value), expected)
+
+    def test_validateRejectsUnknownBooleanToken(self):
+        with self.assertRaises(ValueError):
+            self.column.validate("yesterday")
+
+    def test_onlyStrColumnsCanBeCategorical(self):
+        with self.assertRaises(ValueError):
+            CsvColumn("Volume", int, categorical=True)
+
+
+class TestCsvSchema(unittest.TestCase):
+    def setUp(self):
+        self.schema = CsvSchema(
+            [
+                CsvColumn("ticker", str),
+                CsvColumn("Volume", int),
+                CsvColumn("Open", float, optional=True),
+            ]
+        )
+
+    def test_validateRowConvertsValues(self):
+        self.assertEqual(
+            self.schema.validate_row({"ticker": "EUNL.DE", "Volume": "3", "Open": ""}),
+            {"ticker": "EUNL.DE", "Volume": 3, "Open": None},
+        )
+
+    def test_validateRowFillsMissingOptionalColumn(self):
+        self.assertEqual(
+            self.schema.validate_row({"ticker": "EUNL.DE", "Volume": 3}),
+            {"ticker": "EUNL.DE", "Volume": 3, "Open": None},
+        )
+
+    def test_validateRowRejectsMissingRequiredColumn(self):
+        with self.assertRaises(ValueError) as context:
+            self.schema.validate_row({"ticker": "EUNL.DE"})
+        self.assertIn("Required column 'Volume' is missing", str(context.exception))
+
+    def test_validateRowRejectsInvalidValue(self):
+        with self.assertRaises(ValueError) as context:
+            self.schema.validate_row({"ticker": "EUNL.DE", "Volume": "1.5"})
+        self.assertIn("Column 'Volume'", str(context.exception))
+
+    def test_positionalValidatorFollowsHeaderOrder(self):
+        validate_cells = self.schema.build_positional_validator(
+            ["Volume", "date", "ticker"]
+        )
+
+        self.assertEqual(
+            validate_cells(["3", "2025-03-25", "EUNL.DE"]), ("EUNL.DE", 3, None)
+        )
+        with self.assertRaises(ValueError) as context:
+            validate_cells(["3", "2025-03-25", ""])
+        self.assertIn("Column 'ticker' is required", str(context.exception))
+
+    def test_positionalValidatorRejectsMissingRequiredColumn(self):
+        validate_cells = self.schema.build_positional_validator(["ticker", "Open"])
+
+        with self.assertRaises(ValueError) as context:
+            validate_cells(["EUNL.DE", "1.5"])
+        self.assertIn("Required column 'Volume'", str(context.exception))
@@ -0,0 +1,293 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+from investments.repository import CsvColumn, CsvSchema, LocalCsvRepository
+from investments.repository import local_csv_repository
+
+
+class TestLocalCsvRepository(unittest.TestCase):
+    def setUp(self):
+        self.schema = CsvSchema(
+            [
+                CsvColumn("ticker", str),
+                CsvColumn("date", str),
+                CsvColumn("Open", float),
+                CsvColumn("Volume", int),
+                CsvColumn("adjusted", bool, optional=True),
+            ]
+        )
+        file_descriptor, self.path = tempfile.mkstemp(suffix=".csv")
+        os.close(file_descriptor)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def createRepository(self, content):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return LocalCsvRepository(self.path, self.schema)
+
+    def test_loadConvertsValuesToColumnTypes(self):
+        repository = self.createRepository(
+            "ticker,date,Open,Volume,adjusted\n"
+            "EUNL.DE,2025-03-25,100.78,1200,yes\n"
+            "EUNL.DE,2025-03-26,0.1,-3,\n"
+        )
+
+        repository.load()
+
+        self.assertEqual(
+            repository.get_all(),
+            [
+                {
+                    "ticker": "EUNL.DE",
+                    "date": "2025-03-25",
+                    "Open": 100.78,
+                    "Volume": 1200,
+                    "adjusted": True,
+                },
+                {
+                    "ticker": "EUNL.DE",
+                    "date": "2025-03-26",
+                    "Open": 0.1,
+                    "Volume": -3,
+                    "adjusted": None,
+                },
+            ],
+        )
+        self.assertIs(type(repository.get_all()[0]["Volume"]), int)
+
+    def test_loadAcceptsAnyBooleanCase(self):
+        repository = self.createRepository(
+            "ticker,date,Open,Volume,adjusted\nEUNL.DE,2025-03-25,1,1,yEs\n"
+        )
+
+        repository.load()
+
+        self.assertIs(repository.get_all()[0]["adjusted"], True)
+
+    def test_loadKeepsIntegersBeyondInt64(self):
+        repository = self.createRepository(
+            "ticker,date,Open,Volume\n"
+            "EUNL.DE,2025-03-25,1, +12 \n"
+            "EUNL.DE,2025-03-26,1,123456789012345678901\n"
+        )
+
+        repository.load()
+
+        self.assertEqual(
+            [row["Volume"] for row in repository.get_all()],
+            [12, 123456789012345678901],
+        )
+
+    def test_loadReportsRowOfInvalidValue(self):
+        repository = self.createRepository(
+            "ticker,date,Open,Volume\n"
+            "EUNL.DE,2025-03-25,1,1\n"
+            "EUNL.DE,2025-03-26,1,1.0\n"
+        )
+
+        with self.assertRaises(ValueError) as context:
+            repository.load()
+        self.assertIn("Validation error at row 3", str(context.exception))
+
+    def test_loadRejectsBooleanTokensInFloatColumn(self):
+        repository = self.createRepository(
+            "ticker,date,Open,Volume\nEUNL.DE,2025-03-25,yes,1\n"
+        )
+
+        with self.assertRaises(ValueError) as context:
+            repository.load()
+        self.assertIn("Cannot convert 'yes' to float", str(context.exception))
+
+    def test_loadKeepsLastOfRepeatedColumns(self):
+        repository = self.createRepository(
+            "ticker,date,Open,Volume,Open\nEUNL.DE,2025-03-25,1.0,1,2.0\n"
+        )
+
+        repository.load()
+
+        self.assertEqual(repository.get_all()[0]["Open"], 2.0)
+
+    def test_loadRejectsByteOrderMark(self):
+        repository = self.createRepository(
+            "\ufeffticker,date,Open,Volume\nEUNL.DE,2025-03-25,1,1\n"
+        )
+
+        with self.assertRaises(ValueError) as context:
+            repository.load()
+        self.assertIn("Required column 'ticker' is missing", str(context.exception))
+
+    def test_loadParsesChunksInParallel(self):
+        content = "ticker,date,Open,Volume,adjusted\n" + "".join(
+            f"T{i % 7},2025-03-{i % 28 + 1:02d},{i / 3!r},{i},{'yes' if i % 2 else ''}\n"
+            for i in range(500)
+        )
+        single = self.createRepository(content)
+        single.load()
+        parallel = LocalCsvRepository(self.path, self.schema, max_workers=3)
+
+        with mock.patch.object(local_csv_repository, "_PARALLEL_CHUNK_BYTES", 1024):
+            self.assertEqual(len(parallel._split_chunks()), 3)
+            parallel.load()
+        self.assertEqual(parallel.get_all(), single.get_all())
+
+    def test_loadReportsMissingRequiredValue(self):
+        repository = self.createRepository("ticker,date,Open,Volume\nEUNL.DE,,1,1\n")
+
+        with self.assertRaises(ValueError) as context:
+            repository.load()
+        self.assertIn("Column 'date' is required", str(context.exception))
+
+    def test_loadValidatesQuotedAndUnquotedFilesAlike(self):
+        self.schema = CsvSchema([CsvColumn("ticker", str), CsvColumn("Open", Decimal)])
+        unquoted = self.createRepository("ticker,Open\nEUNL.DE,1.5\n\nVUAA.DE,2\n")
+        unquoted.load()
+        quoted = self.createRepository(
+            'ticker,Open\r\n"EUNL.DE",1.5\r\n\r\n"VUAA.DE","2"\r\n'
+        )
+        quoted.load()
+
+        self.assertEqual(
+            unquoted.get_all(),
+            [
+                {"ticker": "EUNL.DE", "Open": Decimal("1.5")},
+                {"ticker": "VUAA.DE", "Open": Decimal("2")},
+            ],
+        )
+        self.assertEqual(quoted.get_all(), unquoted.get_all())
+
+    def test_loadSharesRepeatedStrings(self):
+        self.schema = CsvSchema([CsvColumn("ticker", str), CsvColumn("Open", Decimal)])
+        repository = self.createRepository(
+            "ticker,Open\n" + "".join(f"EUNL.DE,{i}\n" for i in range(40))
+        )
+
+        repository.load()
+
+        rows = repository.find_all(ticker="EUNL.DE")
+        self.assertEqual(len(rows), 40)
+        self.assertIs(rows[0]["ticker"], rows[-1]["ticker"])
+
+    def test_findReturnsFirstMatchingRow(self):
+        repository = self.createRepository(
+            "ticker,date,Open,Volume\n"
+            "EUNL.DE,2025-03-25,1,1\n"
+            "EUNL.DE,2025-03-26,2,1\n"
+        )
+        repository.load()
+
+        self.assertEqual(repository.find(date="2025-03-26")["Open"], 2.0)
+        self.assertIsNone(repository.find(ticker="VUAA.DE"))
+
+    def test_findAllMatchesEveryFilter(self):
+        repository = self.createRepository(
+            "ticker,date,Open,Volume\n"
+            "EUNL.DE,2025-03-25,1,1\n"
+            "VUAA.DE,2025-03-25,2,1\n"
+            "EUNL.DE,2025-03-26,3,1\n"
+        )
+        repository.load()
+
+        rows = repository.find_all(ticker="EUNL.DE", Volume=1)
+
+        self.assertEqual([row["Open"] for row in rows], [1.0, 3.0])
+        self.assertEqual(repository.find_all(ticker="EUNL.DE", Open=2.0), [])
+
+    def test_findSeesRowsCreatedAfterQuery(self):
+        repository = self.createRepository("ticker,date,Open,Volume\n")
+        repository.load()
+        self.assertIsNone(repository.find(ticker="EUNL.DE"))
+
+        repository.create(
+            [{"ticker": "EUNL.DE", "date": "2025-03-25", "Open": 1.5, "Volume": 2}]
+        )
+
+        self.assertEqual(repository.find(ticker="EUNL.DE")["Open"], 1.5)
+
+    def test_streamRowsYieldsMatchingRowsWithoutLoading(self):
+        repository = self.createRepository(
+            "ticker,date,Open,Volume,adjusted\n"
+            "EUNL.DE,2025-03-25,1,10,\n"
+            "VUAA.DE,2025-03-25,2,20,yes\n"
+            "\n"
+            "EUNL.DE,2025-03-26,3,30,no\n"
+        )
+
+        rows = list(repository.stream_rows(ticker="EUNL.DE"))
+
+        self.assertEqual([row["Volume"] for row in rows], [10, 30])
+        self.assertEqual(list(repository.stream_rows(adjusted=None)), rows[:1])
+        self.assertEqual(
+            list(repository.stream_rows(ticker="EUNL.DE", Open=3)), rows[1:]
+        )
+        self.assertEqual(list(repository.stream_rows(isin="IE00B4L5Y983")), [])
+        self.assertEqual(repository.get_all(), [])
+
+    def test_streamRowsReportsRowOfInvalidValue(self):
+        repository = self.createRepository(
+            "ticker,date,Open,Volume\nEUNL.DE,2025-03-25,1,1\nEUNL.DE,2025-03-26,x,1\n"
+        )
+        rows = repository.stream_rows()
+
+        self.assertEqual(next(rows)["Volume"], 1)
+        with self.assertRaises(ValueError) as context:
+            next(rows)
+        self.assertIn("Validation error at row 3", str(context.exception))
+
+    def test_createWritesHeaderOnlyForNewFile(self):
+        os.remove(self.path)
+        repository = LocalCsvRepository(self.path, self.schema)
+
+        repository.create(
+            [{"ticker": "EUNL.DE", "date": "2025-03-25", "Open": 1.5, "Volume": 10}]
+        )
+        repository.create(
+            [{"ticker": "VUAA.DE", "date": "2025-03-25", "Open": 2, "Volume": 20}]
+        )
+
+        with open(self.path, encoding="utf-8") as file:
+            self.assertEqual(
+                file.read(),
+                "ticker,date,Open,Volume,adjusted\n"
+                "EUNL.DE,2025-03-25,1.5,10,\n"
+                "VUAA.DE,2025-03-25,2.0,20,\n",
+            )
+
+    def test_categoricalColumnReturnsOriginalValues(self):
+        self.schema = CsvSchema(
+            [
+                CsvColumn("ticker", str, categorical=True),
+                CsvColumn("date", str),
+                CsvColumn("Open", float),
+            ]
+        )
+        repository = self.createRepository(
+            "ticker,date,Open\n"
+            "EUNL.DE,2025-03-25,1\n"
+            "VUAA.DE,2025-03-25,2\n"
+            "EUNL.DE,2025-03-26,3\n"
+        )
+        repository.load()
+        repository.create([{"ticker": "SXR8.DE", "date": "2025-03-26", "Open": 4}])
+
+        self.assertEqual(
+            [row["Open"] for row in repository.find_all(ticker="EUNL.DE")], [1.0, 3.0]
+        )
+        self.assertEqual(repository.find(ticker="SXR8.DE")["ticker"], "SXR8.DE")
+        self.assertEqual(repository.find_all(ticker="IWDA.AS"), [])
+
+    def test_toPandasDtypes(self):
+        self.assertEqual(
+            self.schema.to_pandas_dtypes(),
+            {
+                "ticker": "string",
+                "date": "string",
+                "Open": "float64",
+                "Volume": "Int64",
+                "adjusted": "boolean",
+            },
+        )
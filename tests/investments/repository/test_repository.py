@@ -0,0 +1,38 @@
+import unittest
+
+from investments.repository import Repository
+
+
+class ListRepository(Repository):
+    """Repository of rows kept in a list, without a stream_rows of its own."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def load(self):
+        pass
+
+    def find(self, **filters):
+        return next(iter(self.find_all(**filters)), None)
+
+    def find_all(self, **filters):
+        return [
+            row
+            for row in self.rows
+            if all(row.get(column) == value for column, value in filters.items())
+        ]
+
+    def create(self, items):
+        self.rows.extend(items)
+
+
+class TestRepository(unittest.TestCase):
+    def test_streamRowsDefaultsToFindAll(self):
+        repository = ListRepository(
+            [{"ticker": "EUNL.DE", "Open": 1}, {"ticker": "VUAA.DE", "Open": 2}]
+        )
+
+        self.assertEqual(
+            list(repository.stream_rows(ticker="VUAA.DE")),
+            [{"ticker": "VUAA.DE", "Open": 2}],
+        )
@@ -1,6 +1,7 @@
 import unittest
 from datetime import datetime
 from investments.portofolio import BrokerPortofolio
+from tests.investments.amounts import cents
 from investments.cash_operation import (
     CASH,
     DIVIDEND,
@@ -23,6 +24,20 @@ class TestBrokerPortofolio(unittest.TestCase):
         self.assertEqual(len(self.portfolio.cashOperations), 0)
         self.assertEqual(len(self.portfolio.positions), 0)
 
+    def test_cashOperations_is_a_live_read_only_view(self):
+        """Test that cashOperations shows new operations without exposing the list."""
+        operations = self.portfolio.cashOperations
+        timestamp = datetime(2024, 1, 15, 10, 30, 0)
+        self.portfolio.add_deposit(500, timestamp)
+
+        self.assertIs(self.portfolio.cashOperations, operations)
+        self.assertEqual(len(operations), 1)
+        self.assertEqual([op.getAmount() for op in operations], [500])
+        with self.assertRaises(AttributeError):
+            operations.append(operations[0])
+        with self.assertRaises(TypeError):
+            operations[0] = None
+
     def test_get_broker_name(self):
         """Test getting broker name."""
         self.assertEqual(self.portfolio.get_broker_name(), "Unknown")
@@ -52,12 +67,12 @@ class TestBrokerPortofolio(unittest.TestCase):
         timestamp = datetime(2024, 2, 20, 0, 0, 0)
         self.portfolio.add_dividend(25.50, timestamp, "AAPL", "Apple dividend")
 
-        self.assertAlmostEqual(self.portfolio.cash, 25.50, places=2)
+        self.assertEqual(self.portfolio.cash, 25.50)
         self.assertEqual(len(self.portfolio.cashOperations), 1)
 
         operation = self.portfolio.cashOperations[0]
         self.assertEqual(operation.getType(), DIVIDEND)
-        self.assertAlmostEqual(operation.getAmount(), 25.50, places=2)
+        self.assertEqual(operation.getAmount(), 25.50)
         self.assertEqual(operation.timestamp, timestamp)
 
     def test_add_dividend_negative_amount_raises_error(self):
@@ -72,12 +87,12 @@ class TestBrokerPortofolio(unittest.TestCase):
         timestamp = datetime(2024, 3, 1, 0, 0, 0)
         self.portfolio.add_free_funds_interest(2.50, timestamp, "Monthly interest")
 
-        self.assertAlmostEqual(self.portfolio.cash, 2.50, places=2)
+        self.assertEqual(self.portfolio.cash, 2.50)
         self.assertEqual(len(self.portfolio.cashOperations), 1)
 
         operation = self.portfolio.cashOperations[0]
         self.assertEqual(operation.getType(), FREE_FUNDS_INTEREST)
-        self.assertAlmostEqual(operation.getAmount(), 2.50, places=2)
+        self.assertEqual(operation.getAmount(), 2.50)
         self.assertEqual(operation.timestamp, timestamp)
 
     def test_add_free_funds_interest_negative_amount_raises_error(self):
@@ -94,12 +109,12 @@ class TestBrokerPortofolio(unittest.TestCase):
         timestamp = datetime(2024, 3, 1, 0, 0, 0)
         self.portfolio.add_free_funds_interest_tax(-0.50, timestamp, "Tax on interest")
 
-        self.assertAlmostEqual(self.portfolio.cash, -0.50, places=2)
+        self.assertEqual(self.portfolio.cash, -0.50)
         self.assertEqual(len(self.portfolio.cashOperations), 1)
 
         operation = self.portfolio.cashOperations[0]
         self.assertEqual(operation.getType(), FREE_FUNDS_INTEREST_TAX)
-        self.assertAlmostEqual(operation.getAmount(), -0.50, places=2)
+        self.assertEqual(operation.getAmount(), -0.50)
         self.assertEqual(operation.timestamp, timestamp)
 
     def test_add_free_funds_interest_tax_positive_amount_raises_error(self):
@@ -118,14 +133,14 @@ class TestBrokerPortofolio(unittest.TestCase):
             "AAPL", -300.66, timestamp, 10, 30.066, "Buy Apple"
         )
 
-        self.assertAlmostEqual(self.portfolio.cash, -300.66, places=2)
+        self.assertEqual(self.portfolio.cash, -300.66)
         self.assertEqual(len(self.portfolio.cashOperations), 1)
         self.assertEqual(len(self.portfolio.positions), 1)
 
         # Check cash operation
         operation = self.portfolio.cashOperations[0]
         self.assertEqual(operation.getType(), STOCK_PURCHASE)
-        self.assertAlmostEqual(operation.getAmount(), -300.66, places=2)
+        self.assertEqual(operation.getAmount(), -300.66)
         self.assertEqual(operation.timestamp, timestamp)
 
         # Check position
@@ -197,7 +212,7 @@ class TestBrokerPortofolio(unittest.TestCase):
 
         summary = self.portfolio.get_cash_operations_summary()
 
-        self.assertAlmostEqual(summary["total_cash"], 1025.50, places=2)
+        self.assertEqual(cents(summary["total_cash"]), cents(1025.50))
         self.assertEqual(summary["total_operations"], 2)
         self.assertEqual(len(summary["operations_by_type"]), 2)
         self.assertEqual(len(summary["operations"]), 2)
@@ -209,8 +224,21 @@ class TestBrokerPortofolio(unittest.TestCase):
         self.assertEqual(summary["operations_by_type"][CASH]["count"], 1)
         self.assertEqual(summary["operations_by_type"][CASH]["total_amount"], 1000)
         self.assertEqual(summary["operations_by_type"][DIVIDEND]["count"], 1)
-        self.assertAlmostEqual(
-            summary["operations_by_type"][DIVIDEND]["total_amount"], 25.50, places=2
+        self.assertEqual(summary["operations_by_type"][DIVIDEND]["total_amount"], 25.50)
+
+    def test_get_cash_operations_summary_uses_type_names(self):
+        """Test the summary is keyed by type name, in first-seen order."""
+        timestamp = datetime(2024, 1, 15, 10, 30, 0)
+        self.portfolio.add_dividend(25.50, timestamp, "AAPL")
+        self.portfolio.add_deposit(1000, timestamp)
+
+        summary = self.portfolio.get_cash_operations_summary()
+
+        self.assertEqual(list(summary["operations_by_type"]), ["dividend", "deposit"])
+        self.assertEqual(summary["operations_by_type"]["deposit"]["count"], 1)
+        self.assertEqual(
+            [operation["type"] for operation in summary["operations"]],
+            ["dividend", "deposit"],
         )
 
     def test_get_portfolio_summary(self):
@@ -222,12 +250,113 @@ class TestBrokerPortofolio(unittest.TestCase):
         summary = self.portfolio.get_portfolio_summary()
 
         self.assertEqual(summary["broker_name"], "Unknown")
-        self.assertAlmostEqual(summary["total_cash"], 699.34, places=2)
+        self.assertEqual(cents(summary["total_cash"]), cents(699.34))
         self.assertEqual(summary["positions_count"], 1)
         self.assertEqual(len(summary["symbols"]), 1)
         self.assertIn("AAPL", summary["symbols"])
         self.assertIn("cash_operations_summary", summary)
 
+    def test_get_statistics_by_year(self):
+        """Test statistics grouped by year."""
+        self.portfolio.add_deposit(1000, datetime(2023, 5, 1))
+        self.portfolio.add_deposit(500, datetime(2024, 1, 1))
+        self.portfolio.add_deposit(250, datetime(2024, 6, 1))
+        self.portfolio.add_dividend(10.5, datetime(2024, 7, 1), "AAPL")
+        self.portfolio.add_stock_purchase(
+            "AAPL", -300.66, datetime(2024, 1, 15), 10, 30.066
+        )
+        self.portfolio.add_free_funds_interest(2.50, datetime(2024, 3, 1))
+
+        statistics = self.portfolio.get_statistics_by_year()
+
+        self.assertEqual(statistics["deposits"], {2023: 1000, 2024: 750})
+        self.assertEqual(statistics["dividends"], {2024: 10.5})
+        self.assertEqual(statistics["stock_purchases"][2024], 300.66)
+        self.assertEqual(len(statistics["stock_purchases"]), 1)
+
+    def test_get_statistics_by_year_after_new_operations(self):
+        """Test statistics reflect operations recorded after a previous query."""
+        self.portfolio.add_deposit(1000, datetime(2023, 5, 1))
+        first = self.portfolio.get_statistics_by_year()
+
+        self.portfolio.add_deposit(500, datetime(2023, 8, 1))
+        second = self.portfolio.get_statistics_by_year()
+
+        self.assertEqual(first["deposits"], {2023: 1000})
+        self.assertEqual(second["deposits"], {2023: 1500})
+
+    def test_get_statistics_by_month(self):
+        """Test statistics grouped by month."""
+        self.portfolio.add_deposit(100, datetime(2019, 6, 3))
+        self.portfolio.add_deposit(1000, datetime(2023, 12, 31))
+        self.portfolio.add_deposit(500, datetime(2024, 1, 1))
+        self.portfolio.add_deposit(250, datetime(2024, 1, 20))
+        self.portfolio.add_stock_purchase(
+            "AAPL", -300.66, datetime(2024, 1, 15), 10, 30.066
+        )
+
+        statistics = self.portfolio.get_statistics_by_month()
+
+        self.assertEqual(
+            statistics["deposits"], {"2019-06": 100, "2023-12": 1000, "2024-01": 750}
+        )
+        self.assertEqual(statistics["dividends"], {})
+        self.assertEqual(statistics["stock_purchases"]["2024-01"], 300.66)
+
+    def test_get_cash_operations_frame(self):
+        """Test the DataFrame view of cash operations."""
+        self.portfolio.add_deposit(1000, datetime(2023, 12, 31))
+        self.portfolio.add_stock_purchase(
+            "AAPL", -300.66, datetime(2024, 1, 15), 10, 30.066
+        )
+
+        frame = self.portfolio.get_cash_operations_frame()
+
+        self.assertEqual(list(frame["type"]), ["deposit", "stock_purchase"])
+        self.assertEqual(list(frame["amount"]), [1000, -300.66])
+        self.assertEqual(list(frame["year"]), [2023, 2024])
+        self.assertEqual(list(frame["month_key"]), ["2023-12", "2024-01"])
+
+        self.portfolio.add_dividend(5, datetime(2024, 2, 1), "AAPL")
+        self.assertEqual(len(self.portfolio.get_cash_operations_frame()), 3)
+
+    def test_get_total_until(self):
+        """Test running totals up to a point in time."""
+        self.portfolio.add_deposit(500, datetime(2024, 3, 1))
+        self.portfolio.add_deposit(1000, datetime(2024, 1, 1))
+        self.portfolio.add_stock_purchase(
+            "AAPL", -300.5, datetime(2024, 2, 1), 10, 30.05
+        )
+
+        self.assertEqual(
+            self.portfolio.get_total_until(CASH, datetime(2023, 12, 31)), 0
+        )
+        self.assertEqual(
+            self.portfolio.get_total_until(CASH, datetime(2024, 1, 1)), 1000
+        )
+        self.assertEqual(
+            self.portfolio.get_total_until(STOCK_PURCHASE, datetime(2024, 2, 15)), 300.5
+        )
+        self.assertEqual(
+            self.portfolio.get_total_until(CASH, datetime(2025, 1, 1)), 1500
+        )
+
+        self.portfolio.add_deposit(10, datetime(2023, 6, 1))
+        self.assertEqual(
+            self.portfolio.get_total_until(CASH, datetime(2023, 12, 31)), 10
+        )
+
+    def test_operations_of_type(self):
+        """Test that operations are also grouped by type, in recording order."""
+        self.portfolio.add_deposit(1000, datetime(2024, 1, 1))
+        self.portfolio.add_dividend(12.5, datetime(2024, 1, 5), "AAPL")
+        self.portfolio.add_deposit(500, datetime(2024, 2, 1))
+
+        deposits = self.portfolio.operations_of_type(CASH)
+        self.assertEqual([op.amount for op in deposits], [1000, 500])
+        self.assertEqual(len(self.portfolio.operations_of_type(DIVIDEND)), 1)
+        self.assertEqual(self.portfolio.operations_of_type(STOCK_PURCHASE), [])
+        self.assertEqual(self.portfolio.version, 3)
 
-if __name__ == "__main__":
-    unittest.main()
+        recent_deposits = self.portfolio.operations_of_type(CASH, start=1)
+        self.assertEqual([op.amount for op in recent_deposits], [500])
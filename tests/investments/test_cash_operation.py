@@ -1,33 +1,35 @@
 import unittest
-from investments.cash_operation import CashOperation
+from investments.cash_operation import CashOperation, CashOperationType, CASH
 from datetime import datetime
 
 
+_OPERATION_TIMESTAMP = round(datetime(2024, 8, 6, 10, 25, 39).timestamp())
+_FUTURE_TIMESTAMP = round(datetime(2024, 9, 12, 11, 25, 39).timestamp())
+_PAST_TIMESTAMP = round(datetime(2023, 9, 12, 11, 25, 39).timestamp())
+
+
 class TestCashOperation(unittest.TestCase):
-    def setUp(self):
-        timestamp = round(
-            datetime.strptime("06.08.2024 10:25:39", "%d.%m.%Y %H:%M:%S").timestamp()
-        )
-        self.op = CashOperation("deposit", 32.5, timestamp)
+    @classmethod
+    def setUpClass(cls):
+        # The tests only read the operation, so one instance is shared
+        cls.op = CashOperation("deposit", 32.5, _OPERATION_TIMESTAMP)
 
     def test_getTypeReturnsType(self):
-        self.assertEqual(self.op.getType(), "deposit")
+        self.assertEqual(self.op.getType(), CASH)
+
+    def test_typeRoundTripsThroughItsName(self):
+        for operation_type in CashOperationType:
+            with self.subTest(operation_type=operation_type):
+                name = str(operation_type)
+                self.assertIs(CashOperationType.fromName(name), operation_type)
+                self.assertIs(CashOperationType.of(name), operation_type)
+                self.assertIs(CashOperationType.of(operation_type), operation_type)
 
     def test_getAmountReturnsAmount(self):
         self.assertEqual(self.op.getAmount(), 32.5)
 
     def test_isBeforeReturnsTrueIfParamIsInFuture(self):
-        timestamp = round(
-            datetime.strptime("12.09.2024 11:25:39", "%d.%m.%Y %H:%M:%S").timestamp()
-        )
-        self.assertTrue(self.op.isBefore(timestamp))
+        self.assertTrue(self.op.isBefore(_FUTURE_TIMESTAMP))
 
     def test_isBeforeReturnsFalseIfParamIsInPast(self):
-        timestamp = round(
-            datetime.strptime("12.09.2023 11:25:39", "%d.%m.%Y %H:%M:%S").timestamp()
-        )
-        self.assertFalse(self.op.isBefore(timestamp))
-
-
-if __name__ == "__main__":
-    unittest.main()
+        self.assertFalse(self.op.isBefore(_PAST_TIMESTAMP))
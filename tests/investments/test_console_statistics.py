@@ -0,0 +1,129 @@
+import unittest
+from datetime import datetime
+
+from investments.cash_operation import CashOperation
+from investments.console_statistics import ConsoleStatistics, format_statistics
+from investments.portofolio.broker_portofolio import BrokerPortofolio
+
+
+class TestFormatStatistics(unittest.TestCase):
+    def setUp(self):
+        self.statistics = {
+            "deposits": {2024: 1500.0, 2023: 1000.0},
+            "dividends": {},
+        }
+
+    def test_formatStatisticsSortsPeriods(self):
+        lines = format_statistics(self.statistics).splitlines()
+
+        self.assertEqual(lines[6:8], ["2023: €1,000.00", "2024: €1,500.00"])
+
+    def test_formatStatisticsKeepsEmptySections(self):
+        self.assertIn("DIVIDENDS:", format_statistics(self.statistics))
+
+    def test_formatStatisticsSkipsEmptySections(self):
+        text = format_statistics(self.statistics, skip_empty=True)
+
+        self.assertNotIn("DIVIDENDS:", text)
+        self.assertTrue(text.endswith("=" * 60 + "\n"))
+
+
+class OperationsOnlyPortfolio:
+    """Portfolio-like object exposing nothing but a plain cashOperations list."""
+
+    def __init__(self):
+        self.cashOperations = []
+
+
+class TestConsoleStatistics(unittest.TestCase):
+    def setUp(self):
+        self.portfolio = BrokerPortofolio()
+        self.portfolio.add_deposit(1000.0, datetime(2023, 12, 5))
+        self.portfolio.add_deposit(500.0, datetime(2024, 1, 3))
+        self.portfolio.add_dividend(12.5, datetime(2024, 1, 20), "EUNL.DE")
+        self.portfolio.add_free_funds_interest(1.0, datetime(2024, 1, 31))
+        self.portfolio.add_stock_purchase(
+            "EUNL.DE", -300.0, datetime(2024, 1, 4), 3, 100.0
+        )
+        self.statistics = ConsoleStatistics(self.portfolio)
+
+    def test_getAllStatisticsByYear(self):
+        self.assertEqual(
+            self.statistics.get_all_statistics_by_year(),
+            {
+                "deposits": {2023: 1000.0, 2024: 500.0},
+                "dividends": {2024: 12.5},
+                "stock_purchases": {2024: 300.0},
+            },
+        )
+
+    def test_getAllStatisticsByMonth(self):
+        self.assertEqual(
+            self.statistics.get_all_statistics_by_month(),
+            {
+                "deposits": {"2023-12": 1000.0, "2024-01": 500.0},
+                "dividends": {"2024-01": 12.5},
+                "stock_purchases": {"2024-01": 300.0},
+            },
+        )
+        self.assertEqual(self.statistics.get_dividends_by_month(), {"2024-01": 12.5})
+
+    def test_getTotals(self):
+        self.assertEqual(
+            self.statistics.get_totals(),
+            {"deposits": 1500.0, "dividends": 12.5, "stock_purchases": 300.0},
+        )
+
+    def test_statisticsIncludeOperationsAddedLater(self):
+        self.statistics.get_all_statistics_by_year()
+        self.portfolio.add_deposit(250.0, datetime(2022, 6, 1))
+
+        self.assertEqual(
+            list(self.statistics.get_deposits_by_year().items()),
+            [(2023, 1000.0), (2024, 500.0), (2022, 250.0)],
+        )
+
+    def test_statisticsResultsCanBeChangedByCallers(self):
+        self.statistics.get_deposits_by_year()[2023] = 0.0
+
+        self.assertEqual(
+            self.statistics.get_deposits_by_year(), {2023: 1000.0, 2024: 500.0}
+        )
+
+    def test_cashOperationsCannotBypassTheStatistics(self):
+        with self.assertRaises(AttributeError):
+            self.portfolio.cashOperations.append(
+                CashOperation("deposit", 1.0, datetime(2024, 2, 1))
+            )
+
+    def test_statisticsReadPortfoliosWithOnlyCashOperations(self):
+        portfolio = OperationsOnlyPortfolio()
+        statistics = ConsoleStatistics(portfolio)
+        portfolio.cashOperations.append(
+            CashOperation("deposit", 100.0, datetime(2024, 2, 1))
+        )
+        self.assertEqual(statistics.get_deposits_by_year(), {2024: 100.0})
+
+        portfolio.cashOperations.append(
+            CashOperation("stock_purchase", -40.0, datetime(2024, 3, 2))
+        )
+
+        self.assertEqual(statistics.get_stock_purchases_by_month(), {"2024-03": 40.0})
+        self.assertEqual(statistics.get_deposits_by_year(), {2024: 100.0})
+
+    def test_statisticsMatchPortfolioStatistics(self):
+        self.portfolio.add_deposit(250.0, datetime(2022, 6, 1))
+        plain = OperationsOnlyPortfolio()
+        plain.cashOperations.extend(self.portfolio.cashOperations)
+
+        for portfolio in (self.portfolio, plain):
+            with self.subTest(portfolio=type(portfolio).__name__):
+                statistics = ConsoleStatistics(portfolio)
+                self.assertEqual(
+                    list(statistics.get_all_statistics_by_month()["deposits"]),
+                    list(self.portfolio.get_statistics_by_month()["deposits"]),
+                )
+                self.assertEqual(
+                    statistics.get_all_statistics_by_year(),
+                    self.portfolio.get_statistics_by_year(),
+                )
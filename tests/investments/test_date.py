@@ -1,49 +1,53 @@
 import unittest
+from datetime import datetime
 
 from investments.date import Date
 
 
 class TestDate(unittest.TestCase):
-    def test_toString(self):
-        d = Date(24, 3, 2025)
-        self.assertEqual(d.toString(), "2025-03-24")
+    @classmethod
+    def setUpClass(cls):
+        # Dates are immutable, so the fixtures are shared by all tests
+        cls.monday = Date(24, 3, 2025)
+        cls.sunday = Date(23, 3, 2025)
+        cls.saturday = Date(29, 3, 2025)
+        cls.earlier = Date(13, 4, 2024)
 
-    def test_isWeekDayReturnsTrueForWeekDay(self):
-        d = Date(24, 3, 2025)
-        self.assertTrue(d.isWeekDay())
+    def test_toString(self):
+        self.assertEqual(self.monday.toString(), "2025-03-24")
 
-    def test_isWeekDayReturnsFalseForWeekendDay(self):
-        d = Date(23, 3, 2025)
-        self.assertFalse(d.isWeekDay())
+    def test_isWeekDay(self):
+        for date, expected in [(self.monday, True), (self.sunday, False)]:
+            with self.subTest(date=date.toString()):
+                self.assertEqual(date.isWeekDay(), expected)
 
     def test_isBeforeReturnsFalse(self):
-        date1 = Date(23, 3, 2025)
-        date2 = Date(13, 4, 2024)
-
-        self.assertFalse(date1.isBefore(date2))
+        self.assertFalse(self.sunday.isBefore(self.earlier))
 
     def test_isBeforeReturnTrue(self):
-        date1 = Date(23, 3, 2025)
-        date2 = Date(13, 4, 2024)
-
-        self.assertTrue(date2.isBefore(date1))
-
-    def test_getLastWeekDayDateReturnsFridayIfSaturday(self):
-        d = Date(29, 3, 2025)
-        self.assertEqual(d.getLastWeekDayDate().toString(), "2025-03-28")
-
-    def test_getLastWeekDayDateReturnsFridayIfSunday(self):
-        d = Date(23, 3, 2025)
-        self.assertEqual(d.getLastWeekDayDate().toString(), "2025-03-21")
-
-    def test_getLastWeekDayDateReturnsCurrentDayIfWeekDay(self):
-        d = Date(24, 3, 2025)
-        self.assertEqual(d.getLastWeekDayDate().toString(), "2025-03-24")
+        self.assertTrue(self.earlier.isBefore(self.sunday))
+
+    def test_getLastWeekDayDate(self):
+        # Weekend days go back to Friday, week days are returned as they are
+        cases = [
+            (self.saturday, "2025-03-28"),
+            (self.sunday, "2025-03-21"),
+            (self.monday, "2025-03-24"),
+        ]
+
+        for date, expected in cases:
+            with self.subTest(date=date.toString()):
+                self.assertEqual(date.getLastWeekDayDate().toString(), expected)
+
+    def test_ofReturnsSharedInstanceForSameDate(self):
+        d = Date.of(24, 3, 2025)
+        self.assertIs(d, Date.of(24, 3, 2025))
+        self.assertEqual(d.toString(), "2025-03-24")
 
     def test_getNextDay(self):
-        d = Date(24, 3, 2025)
-        self.assertEqual(d.getNextDay().toString(), "2025-03-25")
-
+        self.assertEqual(self.monday.getNextDay().toString(), "2025-03-25")
 
-if __name__ == "__main__":
-    unittest.main()
+    def test_getNextDayCrossesLeapDay(self):
+        d = Date(28, 2, 2024).getNextDay()
+        self.assertEqual(d.toDatetime(), datetime(2024, 2, 29))
+        self.assertTrue(Date(28, 2, 2024).isBefore(d))
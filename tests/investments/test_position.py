@@ -6,46 +6,39 @@ from investments.date import Date
 
 
 class FakeTicker(Ticker):
-    def getPriceOn(self, date: Date):
-        test_date = Date(20, 4, 2024)
+    _PRICE_CHANGE_DATE = Date(20, 4, 2024)
+    _NAME = "FAKE"
 
-        if date.isBefore(test_date):
+    def getPriceOn(self, date: Date):
+        if date.isBefore(self._PRICE_CHANGE_DATE):
             return 52.3
 
         return 67.5
 
     def getTickerName(self) -> str:
-        return "FAKE"
+        return self._NAME
 
 
 class TestPosition(unittest.TestCase):
-    def setUp(self):
-        ticker = FakeTicker()
-
-        self.position = Position(ticker)
-        self.position.registerBuy(Date(12, 3, 2024), 15)
-        self.position.registerBuy(Date(17, 4, 2024), 16)
-        self.position.registerSell(Date(25, 5, 2024), 13)
+    @classmethod
+    def setUpClass(cls):
+        # The tests only query the position, so it is built once
+        cls.position = Position(FakeTicker())
+        cls.position.registerBuy(Date(12, 3, 2024), 15)
+        cls.position.registerBuy(Date(17, 4, 2024), 16)
+        cls.position.registerSell(Date(25, 5, 2024), 13)
+
+        cls.before_buys = Date(10, 3, 2024)
+        cls.before_price_change = Date(19, 4, 2024)
+        cls.after_price_change = Date(21, 4, 2024)
+        cls.after_sell = Date(26, 5, 2024)
 
     def test_getValueReturnsZeroBeforeBuys(self):
-        date = Date(10, 3, 2024)
-
-        self.assertEqual(self.position.getValueOn(date), 0)
+        self.assertEqual(self.position.getValueOn(self.before_buys), 0)
 
     def test_getValueTakesIntoAccountPrice(self):
-        date1 = Date(19, 4, 2024)
-
-        self.assertEqual(self.position.getValueOn(date1), 1621.3)
-
-        date2 = Date(21, 4, 2024)
-
-        self.assertEqual(self.position.getValueOn(date2), 2092.5)
+        self.assertEqual(self.position.getValueOn(self.before_price_change), 1621.3)
+        self.assertEqual(self.position.getValueOn(self.after_price_change), 2092.5)
 
     def test_getvalueTakesIntoAccountAmmount(self):
-        date = Date(26, 5, 2024)
-
-        self.assertEqual(self.position.getValueOn(date), 1215)
-
-
-if __name__ == "__main__":
-    unittest.main()
+        self.assertEqual(self.position.getValueOn(self.after_sell), 1215)
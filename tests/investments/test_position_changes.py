@@ -4,12 +4,20 @@ from investments.position import PositionChanges
 from investments.date import Date
 
 
+def _createChanges():
+    changes = PositionChanges()
+    changes.registerBuy(Date(12, 3, 2024), 15)
+    changes.registerBuy(Date(17, 4, 2024), 16)
+    changes.registerSell(Date(25, 5, 2024), 13)
+    return changes
+
+
 class TestPositionChanges(unittest.TestCase):
-    def setUp(self):
-        self.changes = PositionChanges()
-        self.changes.registerBuy(Date(12, 3, 2024), 15)
-        self.changes.registerBuy(Date(17, 4, 2024), 16)
-        self.changes.registerSell(Date(25, 5, 2024), 13)
+    @classmethod
+    def setUpClass(cls):
+        # Shared by the read-only tests, the one registering more changes
+        # builds its own
+        cls.changes = _createChanges()
 
     def test_getAmountReturnsZeroWhenNoChanges(self):
         changes = PositionChanges()
@@ -32,6 +40,16 @@ class TestPositionChanges(unittest.TestCase):
 
         self.assertEqual(self.changes.getAmountOn(date), 18)
 
+    def test_getAmountsOnReturnsAmountForEachDate(self):
+        dates = [Date(10, 2, 2024), Date(19, 4, 2024), Date(26, 5, 2024)]
+
+        self.assertEqual(self.changes.getAmountsOn(dates), [0, 31, 18])
+
+    def test_getAmountTakesIntoAccountChangesRegisteredAfterQuery(self):
+        changes = _createChanges()
+        date = Date(26, 5, 2024)
+        self.assertEqual(changes.getAmountOn(date), 18)
+
+        changes.registerBuy(Date(1, 1, 2024), 2)
 
-if __name__ == "__main__":
-    unittest.main()
+        self.assertEqual(changes.getAmountOn(date), 20)
@@ -2,336 +2,461 @@ import unittest
 import csv
 import io
 from datetime import datetime
+from unittest import mock
+import pandas as pd
 from investments.portofolio import XtbPortofolio
+from tests.investments.amounts import cents
+
+
+_T_JAN1 = datetime(2024, 1, 1)
+_T_FEB20 = datetime(2024, 2, 20)
+_T_MAR1 = datetime(2024, 3, 1)
+_T_JAN15 = datetime(2024, 1, 15, 10, 30)
+
+_TXN_DEFAULTS = {
+    "type": "",
+    "amount": 0.0,
+    "time": _T_JAN1,
+    "symbol": "CASH",
+    "comment": "",
+}
+
+
+def _txn(**overrides):
+    """Build a parsed transaction dict from the shared defaults."""
+    return {**_TXN_DEFAULTS, **overrides}
+
+
+# Valid transactions, with the resulting cash and position symbols
+_PROCESS_CASES = [
+    (_txn(type="deposit", amount=1000.0, comment="Initial deposit"), 1000.0, []),
+    (
+        _txn(
+            type="DIVIDENT",
+            amount=25.50,
+            time=_T_FEB20,
+            symbol="AAPL",
+            comment="Apple dividend",
+        ),
+        25.50,
+        [],
+    ),
+    (
+        _txn(
+            type="Free-funds Interest",
+            amount=2.50,
+            time=_T_MAR1,
+            comment="Monthly interest",
+        ),
+        2.50,
+        [],
+    ),
+    (
+        _txn(
+            type="Free-funds Interest Tax",
+            amount=-0.50,
+            time=_T_MAR1,
+            comment="Tax on interest",
+        ),
+        -0.50,
+        [],
+    ),
+    (
+        _txn(
+            type="Stock purchase",
+            amount=-300.66,
+            time=_T_JAN15,
+            symbol="AAPL",
+            comment="OPEN BUY 10 @ 30.066",
+        ),
+        -300.66,
+        ["AAPL"],
+    ),
+]
+
+_GETTER_TXNS = [
+    {"id": "1", "type": "deposit", "symbol": "CASH", "amount": 1000.0},
+    {"id": "2", "type": "Stock purchase", "symbol": "AAPL", "amount": -300.66},
+    {"id": "3", "type": "Stock purchase", "symbol": "AAPL", "amount": -200.0},
+]
+
+_HEADER = ["ID", "Type", "Time", "Comment", "Symbol", "Amount"]
+
+_BASIC_ROWS = [
+    _HEADER,
+    ["1", "deposit", "01/01/2024 00:00:00", "Initial deposit", "CASH", "1000.00"],
+    [
+        "2",
+        "Stock purchase",
+        "15/01/2024 10:30:00",
+        "OPEN BUY 10 @ 30.066",
+        "AAPL",
+        "-300.66",
+    ],
+]
+
+# Kept as raw text so the quoted-field handling of csv.reader stays covered
+_EUROPEAN_CSV = """ID,Type,Time,Comment,Symbol,Amount
+1,deposit,01/01/2024 00:00:00,Initial deposit,CASH,"1000,50"
+2,Stock purchase,15/01/2024 10:30:00,"OPEN BUY 5 @ 30,066",AAPL,"-150,33" """
 
-
-class TestXtbPortofolio(unittest.TestCase):
-
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.portfolio = XtbPortofolio()
-
-    def test_initialization(self):
-        """Test that XtbPortofolio initializes correctly."""
-        self.assertEqual(self.portfolio.broker_name, "XTB")
-        self.assertEqual(self.portfolio.cash, 0)
-        self.assertEqual(len(self.portfolio.cashOperations), 0)
-        self.assertEqual(len(self.portfolio.positions), 0)
-        self.assertEqual(len(self.portfolio.transactions), 0)
+_COMPREHENSIVE_ROWS = _BASIC_ROWS + [
+    ["3", "DIVIDENT", "20/02/2024 00:00:00", "Apple dividend", "AAPL", "25.50"],
+    [
+        "4",
+        "Free-funds Interest",
+        "01/03/2024 00:00:00",
+        "Monthly interest",
+        "CASH",
+        "2.50",
+    ],
+    [
+        "5",
+        "Free-funds Interest Tax",
+        "01/03/2024 00:00:00",
+        "Tax on interest",
+        "CASH",
+        "-0.50",
+    ],
+    [
+        "6",
+        "Stock purchase",
+        "10/03/2024 14:15:00",
+        "OPEN BUY 3/35 @ 5.8760",
+        "MSFT",
+        "-17.63",
+    ],
+]
+
+
+# Malformed inputs for createFromCsv, paired with the expected error message
+_CSV_ERROR_CASES = [
+    (
+        [["Wrong", "Header", "Format"], ["1", "deposit", "01/01/2024 00:00:00"]],
+        "Invalid CSV header",
+    ),
+    ([], "CSV file is empty"),
+    (
+        [
+            _HEADER,
+            ["1", "deposit", "01/01/2024 00:00:00", "Initial deposit", "1000.00"],
+        ],
+        "Expected 6 columns, got 5",
+    ),
+    (
+        [
+            _HEADER,
+            [
+                "1",
+                "deposit",
+                "2024-01-01 00:00:00",
+                "Initial deposit",
+                "CASH",
+                "1000.00",
+            ],
+        ],
+        "Invalid time format",
+    ),
+    (
+        [
+            _HEADER,
+            ["1", "deposit", "01/01/2024 00:00:00", "Initial deposit", "CASH", "x"],
+        ],
+        "Invalid amount",
+    ),
+    (
+        [
+            _HEADER,
+            [
+                "",
+                "deposit",
+                "01/01/2024 00:00:00",
+                "Initial deposit",
+                "CASH",
+                "1000.00",
+            ],
+        ],
+        "ID cannot be empty",
+    ),
+]
+
+
+class TestXtbPortofolioStateless(unittest.TestCase):
+    """Tests for the parsing entry points, which build their own portfolios."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Parse the CSV fixtures that tests only read from, once per class."""
+        cls.basic_portfolio = XtbPortofolio.createFromCsv(iter(_BASIC_ROWS))
+        cls.european_portfolio = XtbPortofolio.createFromCsv(
+            csv.reader(_EUROPEAN_CSV.splitlines())
+        )
+        cls.comprehensive_portfolio = XtbPortofolio.createFromCsv(
+            iter(_COMPREHENSIVE_ROWS)
+        )
 
     def test_createFromCsv_basic_functionality(self):
         """Test creating XtbPortofolio from CSV with basic data."""
-        csv_data = """ID,Type,Time,Comment,Symbol,Amount
-1,deposit,01/01/2024 00:00:00,Initial deposit,CASH,1000.00
-2,Stock purchase,15/01/2024 10:30:00,OPEN BUY 10 @ 30.066,AAPL,-300.66"""
-
-        csv_reader = csv.reader(io.StringIO(csv_data))
-        portfolio = XtbPortofolio.createFromCsv(csv_reader)
+        portfolio = self.basic_portfolio
 
         self.assertEqual(portfolio.broker_name, "XTB")
         self.assertEqual(len(portfolio.transactions), 2)
-        self.assertAlmostEqual(portfolio.cash, 699.34, places=2)  # 1000 - 300.66
+        self.assertEqual(cents(portfolio.cash), cents(699.34))  # 1000 - 300.66
         self.assertEqual(len(portfolio.positions), 1)
         self.assertIn("AAPL", portfolio.positions)
 
     def test_createFromCsv_european_number_format(self):
         """Test creating XtbPortofolio from CSV with European number format."""
-        csv_data = """ID,Type,Time,Comment,Symbol,Amount
-1,deposit,01/01/2024 00:00:00,Initial deposit,CASH,"1000,50"
-2,Stock purchase,15/01/2024 10:30:00,"OPEN BUY 5 @ 30,066",AAPL,"-150,33" """
-
-        csv_reader = csv.reader(io.StringIO(csv_data))
-        portfolio = XtbPortofolio.createFromCsv(csv_reader)
+        portfolio = self.european_portfolio
 
-        self.assertAlmostEqual(portfolio.cash, 850.17, places=2)  # 1000.50 - 150.33
+        self.assertEqual(cents(portfolio.cash), cents(850.17))  # 1000.50 - 150.33
         self.assertEqual(len(portfolio.transactions), 2)
 
-    def test_createFromCsv_invalid_header_raises_error(self):
-        """Test that invalid CSV header raises ValueError."""
-        csv_data = """Wrong,Header,Format
-1,deposit,01/01/2024 00:00:00"""
+    def test_createFromCsv_invalid_input_raises_error(self):
+        """Test that malformed CSV rows raise ValueError with a useful message."""
+        for rows, message in _CSV_ERROR_CASES:
+            with self.subTest(message):
+                with self.assertRaises(ValueError) as context:
+                    XtbPortofolio.createFromCsv(iter(rows))
+                self.assertIn(message, str(context.exception))
+
+    def test_parse_stock_purchase_comment(self):
+        """Test parsing stock purchase comments in the supported formats."""
+        cases = [
+            ("OPEN BUY 10 @ 30.066", 10, 30.066),
+            ("OPEN BUY $5 @ 25.50", 5, 25.50),
+            # The "/35" part is ignored
+            ("OPEN BUY 3/35 @ 5.8760", 3, 5.8760),
+        ]
 
-        csv_reader = csv.reader(io.StringIO(csv_data))
-        with self.assertRaises(ValueError) as context:
-            XtbPortofolio.createFromCsv(csv_reader)
-        self.assertIn("Invalid CSV header", str(context.exception))
+        for comment, expected_stocks, expected_price in cases:
+            with self.subTest(comment=comment):
+                number_of_stocks, price_per_share = (
+                    XtbPortofolio._parse_stock_purchase_comment(comment)
+                )
 
-    def test_createFromCsv_empty_file_raises_error(self):
-        """Test that empty CSV file raises ValueError."""
-        csv_data = ""
+                self.assertEqual(number_of_stocks, expected_stocks)
+                self.assertEqual(price_per_share, expected_price)
 
-        csv_reader = csv.reader(io.StringIO(csv_data))
+    def test_parse_stock_purchase_comment_invalid_format_raises_error(self):
+        """Test that invalid comment format raises ValueError."""
+        comment = "INVALID FORMAT"
         with self.assertRaises(ValueError) as context:
-            XtbPortofolio.createFromCsv(csv_reader)
-        self.assertIn("CSV file is empty", str(context.exception))
+            XtbPortofolio._parse_stock_purchase_comment(comment)
+        self.assertIn("Invalid stock purchase comment format", str(context.exception))
+
+    def test_comprehensive_csv_processing(self):
+        """Test comprehensive CSV processing with all transaction types."""
+        portfolio = self.comprehensive_portfolio
+
+        # Check final cash balance
+        expected_cash = 1000.00 - 300.66 + 25.50 + 2.50 - 0.50 - 17.63
+        self.assertEqual(cents(portfolio.cash), cents(expected_cash))
+
+        # Check positions
+        self.assertEqual(len(portfolio.positions), 2)
+        self.assertIn("AAPL", portfolio.positions)
+        self.assertIn("MSFT", portfolio.positions)
 
-    def test_createFromCsv_wrong_column_count_raises_error(self):
-        """Test that wrong number of columns raises ValueError."""
+        # Check transactions
+        self.assertEqual(len(portfolio.transactions), 6)
+
+        # Check cash operations
+        self.assertEqual(len(portfolio.cashOperations), 6)
+
+    def test_createFromFile_matches_createFromCsv(self):
+        """Test that the pandas loader builds the same portfolio as the CSV reader."""
         csv_data = """ID,Type,Time,Comment,Symbol,Amount
-1,deposit,01/01/2024 00:00:00,Initial deposit,1000.00"""
+1,deposit,01/01/2024 00:00:00,Initial deposit,,"1000,50"
+2,Stock purchase,15/01/2024 10:30:00,OPEN BUY 10 @ 30.066,AAPL,-300.66
+3,DIVIDENT,20/02/2024 00:00:00,Apple dividend,AAPL,25.50"""
 
-        csv_reader = csv.reader(io.StringIO(csv_data))
-        with self.assertRaises(ValueError) as context:
-            XtbPortofolio.createFromCsv(csv_reader)
-        self.assertIn("Expected 6 columns, got 5", str(context.exception))
+        from_file = XtbPortofolio.createFromFile(io.StringIO(csv_data))
+        from_csv = XtbPortofolio.createFromCsv(csv.reader(csv_data.splitlines()))
+
+        self.assertEqual(from_file.transactions, from_csv.transactions)
+        self.assertEqual(from_file.cash, from_csv.cash)
+        self.assertIn("AAPL", from_file.positions)
 
-    def test_createFromCsv_invalid_time_format_raises_error(self):
-        """Test that invalid time format raises ValueError."""
+    def test_createFromFile_reports_invalid_row(self):
+        """Test that the pandas loader reports the first invalid row."""
         csv_data = """ID,Type,Time,Comment,Symbol,Amount
-1,deposit,2024-01-01 00:00:00,Initial deposit,CASH,1000.00"""
+1,deposit,01/01/2024 00:00:00,Initial deposit,CASH,1000.00
+2,deposit,2024-01-02 00:00:00,Second deposit,CASH,1000.00
+3,deposit,03/01/2024 00:00:00,Third deposit,CASH,invalid_amount"""
 
-        csv_reader = csv.reader(io.StringIO(csv_data))
         with self.assertRaises(ValueError) as context:
-            XtbPortofolio.createFromCsv(csv_reader)
-        self.assertIn("Invalid time format", str(context.exception))
+            XtbPortofolio.createFromFile(io.StringIO(csv_data))
+        self.assertIn("Row 3: Invalid time format", str(context.exception))
 
-    def test_createFromCsv_invalid_amount_raises_error(self):
-        """Test that invalid amount format raises ValueError."""
+    def test_createFromFile_does_not_parse_invalid_rows_again(self):
+        """Test that validation errors come from the pandas loader itself."""
         csv_data = """ID,Type,Time,Comment,Symbol,Amount
 1,deposit,01/01/2024 00:00:00,Initial deposit,CASH,invalid_amount"""
 
-        csv_reader = csv.reader(io.StringIO(csv_data))
-        with self.assertRaises(ValueError) as context:
-            XtbPortofolio.createFromCsv(csv_reader)
-        self.assertIn("Invalid amount", str(context.exception))
+        with mock.patch.object(XtbPortofolio, "createFromCsv") as create_from_csv:
+            with self.assertRaises(ValueError) as context:
+                XtbPortofolio.createFromFile(io.StringIO(csv_data))
+        create_from_csv.assert_not_called()
+        self.assertIn("Row 2: Invalid amount", str(context.exception))
 
-    def test_createFromCsv_empty_id_raises_error(self):
-        """Test that empty ID raises ValueError."""
+    def test_createFromFile_reports_short_row(self):
+        """Test that a row with missing columns is reported like createFromCsv."""
         csv_data = """ID,Type,Time,Comment,Symbol,Amount
-,deposit,01/01/2024 00:00:00,Initial deposit,CASH,1000.00"""
+1,deposit,01/01/2024 00:00:00,Initial deposit,CASH,1000.00
+2,deposit,02/01/2024 00:00:00,Second deposit,1000.00"""
 
-        csv_reader = csv.reader(io.StringIO(csv_data))
         with self.assertRaises(ValueError) as context:
-            XtbPortofolio.createFromCsv(csv_reader)
-        self.assertIn("ID cannot be empty", str(context.exception))
-
-    def test_parse_stock_purchase_comment_standard_format(self):
-        """Test parsing stock purchase comment in standard format."""
-        comment = "OPEN BUY 10 @ 30.066"
-        number_of_stocks, price_per_share = XtbPortofolio._parse_stock_purchase_comment(
-            comment
-        )
+            XtbPortofolio.createFromFile(io.StringIO(csv_data))
+        self.assertIn("Row 3: Expected 6 columns, got 5", str(context.exception))
 
-        self.assertEqual(number_of_stocks, 10)
-        self.assertAlmostEqual(price_per_share, 30.066, places=3)
+    def test_createFromFile_reports_blank_line(self):
+        """Test that a blank line is reported with its row number in the file."""
+        csv_data = """ID,Type,Time,Comment,Symbol,Amount
 
-    def test_parse_stock_purchase_comment_with_dollar_sign(self):
-        """Test parsing stock purchase comment with dollar sign."""
-        comment = "OPEN BUY $5 @ 25.50"
-        number_of_stocks, price_per_share = XtbPortofolio._parse_stock_purchase_comment(
-            comment
-        )
+2,deposit,2024-01-02 00:00:00,Second deposit,CASH,1000.00"""
+
+        with self.assertRaises(ValueError) as context:
+            XtbPortofolio.createFromFile(io.StringIO(csv_data))
+        self.assertIn("Row 2: Expected 6 columns, got 0", str(context.exception))
 
-        self.assertEqual(number_of_stocks, 5)
-        self.assertAlmostEqual(price_per_share, 25.50, places=2)
+    def test_createFromFile_empty_file_raises_error(self):
+        """Test that an empty file raises ValueError."""
+        with self.assertRaises(ValueError) as context:
+            XtbPortofolio.createFromFile(io.StringIO(""))
+        self.assertIn("CSV file is empty", str(context.exception))
 
-    def test_parse_stock_purchase_comment_with_fraction_format(self):
-        """Test parsing stock purchase comment with fraction format."""
-        comment = "OPEN BUY 3/35 @ 5.8760"
-        number_of_stocks, price_per_share = XtbPortofolio._parse_stock_purchase_comment(
-            comment
+    def test_createFromDataFrame_loads_transactions(self):
+        """Test that a frame of strings is parsed like the CSV file."""
+        frame = pd.DataFrame(
+            [["1", "deposit", "01/01/2024 00:00:00", "Initial deposit", "", "1000,50"]],
+            columns=["ID", "Type", "Time", "Comment", "Symbol", "Amount"],
         )
 
-        self.assertEqual(number_of_stocks, 3)
-        self.assertAlmostEqual(price_per_share, 5.8760, places=4)
+        portfolio = XtbPortofolio.createFromDataFrame(frame)
 
-    def test_parse_stock_purchase_comment_invalid_format_raises_error(self):
-        """Test that invalid comment format raises ValueError."""
-        comment = "INVALID FORMAT"
+        self.assertEqual(portfolio.cash, 1000.50)
+        self.assertEqual(portfolio.transactions[0]["time"], _T_JAN1)
+
+    def test_createFromDataFrame_invalid_columns_raises_error(self):
+        """Test that a frame without the XTB columns raises ValueError."""
         with self.assertRaises(ValueError) as context:
-            XtbPortofolio._parse_stock_purchase_comment(comment)
-        self.assertIn("Invalid stock purchase comment format", str(context.exception))
+            XtbPortofolio.createFromDataFrame(pd.DataFrame(columns=["ID", "Type"]))
+        self.assertIn("Invalid CSV header", str(context.exception))
 
-    def test_process_transaction_deposit(self):
-        """Test processing deposit transaction."""
-        transaction = {
-            "type": "deposit",
-            "amount": 1000.0,
-            "time": datetime(2024, 1, 1, 0, 0, 0),
-            "symbol": "CASH",
-            "comment": "Initial deposit",
-        }
 
-        XtbPortofolio._process_transaction(self.portfolio, transaction)
+class TestXtbPortofolioStateful(unittest.TestCase):
+    """Tests that drive a fresh, empty portfolio."""
 
-        self.assertAlmostEqual(self.portfolio.cash, 1000.0, places=1)
-        self.assertEqual(len(self.portfolio.cashOperations), 1)
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.portfolio = XtbPortofolio()
+
+    def test_initialization(self):
+        """Test that XtbPortofolio initializes correctly."""
+        self.assertEqual(self.portfolio.broker_name, "XTB")
+        self.assertEqual(self.portfolio.cash, 0)
+        self.assertEqual(len(self.portfolio.cashOperations), 0)
+        self.assertEqual(len(self.portfolio.positions), 0)
+        self.assertEqual(len(self.portfolio.transactions), 0)
+
+    def test_process_transaction(self):
+        """Test processing each supported transaction type."""
+        for transaction, expected_cash, expected_positions in _PROCESS_CASES:
+            with self.subTest(transaction["type"]):
+                portfolio = XtbPortofolio()
+
+                XtbPortofolio._process_transaction(portfolio, transaction)
+
+                self.assertEqual(portfolio.cash, expected_cash)
+                self.assertEqual(len(portfolio.cashOperations), 1)
+                self.assertEqual(list(portfolio.positions), expected_positions)
 
     def test_process_transaction_deposit_negative_amount_raises_error(self):
         """Test that negative deposit amount raises ValueError."""
-        transaction = {
-            "type": "deposit",
-            "amount": -1000.0,
-            "time": datetime(2024, 1, 1, 0, 0, 0),
-            "symbol": "CASH",
-            "comment": "Invalid deposit",
-        }
+        transaction = _txn(type="deposit", amount=-1000.0, comment="Invalid deposit")
 
         with self.assertRaises(ValueError) as context:
             XtbPortofolio._process_transaction(self.portfolio, transaction)
         self.assertIn("Deposit amount must be positive", str(context.exception))
 
-    def test_process_transaction_dividend(self):
-        """Test processing dividend transaction."""
-        transaction = {
-            "type": "DIVIDENT",
-            "amount": 25.50,
-            "time": datetime(2024, 2, 20, 0, 0, 0),
-            "symbol": "AAPL",
-            "comment": "Apple dividend",
-        }
-
-        XtbPortofolio._process_transaction(self.portfolio, transaction)
-
-        self.assertAlmostEqual(self.portfolio.cash, 25.50, places=2)
-        self.assertEqual(len(self.portfolio.cashOperations), 1)
-
-    def test_process_transaction_free_funds_interest(self):
-        """Test processing free funds interest transaction."""
-        transaction = {
-            "type": "Free-funds Interest",
-            "amount": 2.50,
-            "time": datetime(2024, 3, 1, 0, 0, 0),
-            "symbol": "CASH",
-            "comment": "Monthly interest",
-        }
-
-        XtbPortofolio._process_transaction(self.portfolio, transaction)
-
-        self.assertAlmostEqual(self.portfolio.cash, 2.50, places=2)
-        self.assertEqual(len(self.portfolio.cashOperations), 1)
-
-    def test_process_transaction_free_funds_interest_tax(self):
-        """Test processing free funds interest tax transaction."""
-        transaction = {
-            "type": "Free-funds Interest Tax",
-            "amount": -0.50,
-            "time": datetime(2024, 3, 1, 0, 0, 0),
-            "symbol": "CASH",
-            "comment": "Tax on interest",
-        }
-
-        XtbPortofolio._process_transaction(self.portfolio, transaction)
-
-        self.assertAlmostEqual(self.portfolio.cash, -0.50, places=2)
-        self.assertEqual(len(self.portfolio.cashOperations), 1)
-
-    def test_process_transaction_stock_purchase(self):
-        """Test processing stock purchase transaction."""
-        transaction = {
-            "type": "Stock purchase",
-            "amount": -300.66,
-            "time": datetime(2024, 1, 15, 10, 30, 0),
-            "symbol": "AAPL",
-            "comment": "OPEN BUY 10 @ 30.066",
-        }
-
-        XtbPortofolio._process_transaction(self.portfolio, transaction)
-
-        self.assertAlmostEqual(self.portfolio.cash, -300.66, places=2)
-        self.assertEqual(len(self.portfolio.cashOperations), 1)
-        self.assertEqual(len(self.portfolio.positions), 1)
-        self.assertIn("AAPL", self.portfolio.positions)
-
     def test_process_transaction_stock_purchase_positive_amount_raises_error(self):
         """Test that positive stock purchase amount raises ValueError."""
-        transaction = {
-            "type": "Stock purchase",
-            "amount": 300.66,
-            "time": datetime(2024, 1, 15, 10, 30, 0),
-            "symbol": "AAPL",
-            "comment": "OPEN BUY 10 @ 30.066",
-        }
+        transaction = _txn(
+            type="Stock purchase",
+            amount=300.66,
+            time=_T_JAN15,
+            symbol="AAPL",
+            comment="OPEN BUY 10 @ 30.066",
+        )
 
         with self.assertRaises(ValueError) as context:
             XtbPortofolio._process_transaction(self.portfolio, transaction)
         self.assertIn("Stock purchase amount must be negative", str(context.exception))
 
-    def test_get_transactions(self):
-        """Test getting all transactions."""
-        # Add some transactions manually
+    def test_transaction_getters(self):
+        """Test the transaction getters against one shared transaction list."""
+        self.portfolio.transactions = list(_GETTER_TXNS)
+
+        with self.subTest("all"):
+            self.assertEqual(len(self.portfolio.get_transactions()), 3)
+        with self.subTest("by_symbol"):
+            self.assertEqual(len(self.portfolio.get_transactions_by_symbol("AAPL")), 2)
+            self.assertEqual(len(self.portfolio.get_transactions_by_symbol("CASH")), 1)
+        with self.subTest("by_type"):
+            by_type = self.portfolio.get_transactions_by_type
+            self.assertEqual(len(by_type("Stock purchase")), 2)
+            self.assertEqual(len(by_type("deposit")), 1)
+            self.assertEqual(by_type("DIVIDENT"), [])
+        with self.subTest("types"):
+            self.assertEqual(
+                self.portfolio.get_transaction_types(), ["deposit", "Stock purchase"]
+            )
+        with self.subTest("symbol_transactions"):
+            # The overridden method returns the same rows as get_transactions_by_symbol
+            self.assertEqual(
+                self.portfolio.get_symbol_transactions("AAPL"), _GETTER_TXNS[1:]
+            )
+
+    def test_get_transactions_by_symbol_after_reassignment(self):
+        """Test the symbol lookup follows a reassigned transactions list."""
         self.portfolio.transactions = [
-            {"id": "1", "type": "deposit", "amount": 1000.0},
-            {"id": "2", "type": "Stock purchase", "amount": -300.66},
+            {"id": "1", "type": "Stock purchase", "symbol": "AAPL", "amount": -1.0},
         ]
-
-        transactions = self.portfolio.get_transactions()
-        self.assertEqual(len(transactions), 2)
-
-    def test_get_transactions_by_symbol(self):
-        """Test getting transactions by symbol."""
-        # Add some transactions manually
-        self.portfolio.transactions = [
-            {"id": "1", "type": "deposit", "symbol": "CASH", "amount": 1000.0},
-            {"id": "2", "type": "Stock purchase", "symbol": "AAPL", "amount": -300.66},
-            {"id": "3", "type": "Stock purchase", "symbol": "AAPL", "amount": -200.0},
-        ]
-
-        aapl_transactions = self.portfolio.get_transactions_by_symbol("AAPL")
-        self.assertEqual(len(aapl_transactions), 2)
-
-        cash_transactions = self.portfolio.get_transactions_by_symbol("CASH")
-        self.assertEqual(len(cash_transactions), 1)
-
-    def test_get_transactions_by_type(self):
-        """Test getting transactions by type."""
-        # Add some transactions manually
-        self.portfolio.transactions = [
-            {"id": "1", "type": "deposit", "amount": 1000.0},
-            {"id": "2", "type": "Stock purchase", "amount": -300.66},
-            {"id": "3", "type": "Stock purchase", "amount": -200.0},
-        ]
-
-        stock_purchases = self.portfolio.get_transactions_by_type("Stock purchase")
-        self.assertEqual(len(stock_purchases), 2)
-
-        deposits = self.portfolio.get_transactions_by_type("deposit")
-        self.assertEqual(len(deposits), 1)
-
-    def test_get_symbol_transactions(self):
-        """Test getting symbol transactions (overridden method)."""
-        # Add some transactions manually
         self.portfolio.transactions = [
-            {"id": "1", "type": "deposit", "symbol": "CASH", "amount": 1000.0},
-            {"id": "2", "type": "Stock purchase", "symbol": "AAPL", "amount": -300.66},
-            {"id": "3", "type": "Stock purchase", "symbol": "AAPL", "amount": -200.0},
+            {"id": "2", "type": "Stock purchase", "symbol": "MSFT", "amount": -2.0},
         ]
 
-        aapl_transactions = self.portfolio.get_symbol_transactions("AAPL")
-        self.assertEqual(len(aapl_transactions), 2)
+        self.assertEqual(self.portfolio.get_transactions_by_symbol("AAPL"), [])
+        self.assertEqual(len(self.portfolio.get_transactions_by_symbol("MSFT")), 1)
 
-        # Should be the same as get_transactions_by_symbol
-        aapl_transactions_alt = self.portfolio.get_transactions_by_symbol("AAPL")
-        self.assertEqual(len(aapl_transactions), len(aapl_transactions_alt))
-
-    def test_comprehensive_csv_processing(self):
-        """Test comprehensive CSV processing with all transaction types."""
-        csv_data = """ID,Type,Time,Comment,Symbol,Amount
-1,deposit,01/01/2024 00:00:00,Initial deposit,CASH,1000.00
-2,Stock purchase,15/01/2024 10:30:00,OPEN BUY 10 @ 30.066,AAPL,-300.66
-3,DIVIDENT,20/02/2024 00:00:00,Apple dividend,AAPL,25.50
-4,Free-funds Interest,01/03/2024 00:00:00,Monthly interest,CASH,2.50
-5,Free-funds Interest Tax,01/03/2024 00:00:00,Tax on interest,CASH,-0.50
-6,Stock purchase,10/03/2024 14:15:00,OPEN BUY 3/35 @ 5.8760,MSFT,-17.63"""
+    def test_add_transaction_updates_lookups(self):
+        """Test an added transaction shows up in the symbol and type lookups."""
+        self.portfolio.transactions = list(_GETTER_TXNS)
+        transaction = {"id": "4", "type": "DIVIDENT", "symbol": "AAPL", "amount": 1.0}
 
-        csv_reader = csv.reader(io.StringIO(csv_data))
-        portfolio = XtbPortofolio.createFromCsv(csv_reader)
+        self.portfolio.add_transaction(transaction)
 
-        # Check final cash balance
-        expected_cash = 1000.00 - 300.66 + 25.50 + 2.50 - 0.50 - 17.63
-        self.assertAlmostEqual(portfolio.cash, expected_cash, places=2)
+        self.assertEqual(self.portfolio.get_transactions()[-1], transaction)
+        self.assertIn(transaction, self.portfolio.get_transactions_by_symbol("AAPL"))
+        self.assertEqual(
+            self.portfolio.get_transactions_by_type("DIVIDENT"), [transaction]
+        )
 
-        # Check positions
-        self.assertEqual(len(portfolio.positions), 2)
-        self.assertIn("AAPL", portfolio.positions)
-        self.assertIn("MSFT", portfolio.positions)
+    def test_transactions_cannot_be_changed_in_place(self):
+        """Test the returned transactions cannot bypass the lookups."""
+        self.portfolio.transactions = list(_GETTER_TXNS)
 
-        # Check transactions
-        self.assertEqual(len(portfolio.transactions), 6)
+        with self.assertRaises(AttributeError):
+            self.portfolio.transactions.append(_GETTER_TXNS[0])
+        self.portfolio.get_transactions().clear()
 
-        # Check cash operations
-        self.assertEqual(len(portfolio.cashOperations), 6)
+        self.assertEqual(len(self.portfolio.get_transactions()), 3)
 
+    def test_transactions_is_a_live_view(self):
+        """Test the transactions view shows added transactions without a copy."""
+        transactions = self.portfolio.transactions
+        self.portfolio.add_transaction(_GETTER_TXNS[0])
 
-if __name__ == "__main__":
-    unittest.main()
+        self.assertIs(self.portfolio.transactions, transactions)
+        self.assertEqual(list(transactions), [_GETTER_TXNS[0]])
@@ -0,0 +1,20 @@
+import pandas as pd
+
+
+class FakeYfTicker:
+    """Stands in for yf.Ticker, serving three days of history and logging requests."""
+
+    def __init__(self):
+        self.requests = []
+
+    def history(self, start, end):
+        self.requests.append((start, end))
+        index = pd.DatetimeIndex(
+            ["2025-03-21", "2025-03-24", "2025-03-25"], tz="Europe/Berlin"
+        )
+        history = pd.DataFrame(
+            {"Open": [99.5, 99.123, 100.781], "Close": [98.912, 99.9, 100.1]},
+            index=index,
+        )
+        days = history.index.strftime("%Y-%m-%d")
+        return history[(days >= start) & (days < end)]
@@ -0,0 +1,67 @@
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from investments.date import Date
+from investments.ticker import yahoo_finance
+from investments.ticker.yahoo_finance import YahooFinance
+from investments.ticker.yahoo_finance_ticker import YahooFinanceTicker
+
+
+class FakeRepository:
+    def __init__(self):
+        self.created = []
+
+    def create(self, items):
+        self.created.extend(items)
+
+
+class TestYahooFinanceDownload(unittest.TestCase):
+    def setUp(self):
+        self.repository = FakeRepository()
+        self.yahoo_finance = YahooFinance(self.repository)
+        self.index = pd.DatetimeIndex(["2025-03-24", "2025-03-25"], name="Date")
+
+    def download(self, data, symbols):
+        with mock.patch.object(yahoo_finance.yf, "download", return_value=data):
+            self.yahoo_finance.download(
+                [YahooFinanceTicker(symbol) for symbol in symbols],
+                Date(24, 3, 2025),
+                Date(26, 3, 2025),
+            )
+
+    def test_downloadStoresOneRowPerDateAndTicker(self):
+        columns = pd.MultiIndex.from_product(
+            [["EUNL.DE", "VUAA.DE"], ["Open", "Close"]], names=["Ticker", "Price"]
+        )
+        data = pd.DataFrame(
+            [[1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 8.0]],
+            index=self.index,
+            columns=columns,
+        )
+
+        self.download(data, ["EUNL.DE", "VUAA.DE"])
+
+        self.assertCountEqual(
+            self.repository.created,
+            [
+                {"ticker": "EUNL.DE", "date": "2025-03-24", "Open": 1.0, "Close": 2.0},
+                {"ticker": "VUAA.DE", "date": "2025-03-24", "Open": 3.0, "Close": 4.0},
+                {"ticker": "EUNL.DE", "date": "2025-03-25", "Open": 5.0, "Close": 6.0},
+                {"ticker": "VUAA.DE", "date": "2025-03-25", "Open": 7.0, "Close": 8.0},
+            ],
+        )
+
+    def test_downloadStoresSingleTickerWithFlatColumns(self):
+        data = pd.DataFrame({"Open": [1.0, 5.0], "Close": [2.0, 6.0]}, index=self.index)
+
+        self.download(data, ["EUNL.DE"])
+
+        self.assertEqual(
+            self.repository.created,
+            [
+                {"date": "2025-03-24", "Open": 1.0, "Close": 2.0, "ticker": "EUNL.DE"},
+                {"date": "2025-03-25", "Open": 5.0, "Close": 6.0, "ticker": "EUNL.DE"},
+            ],
+        )
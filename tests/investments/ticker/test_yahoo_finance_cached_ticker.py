@@ -0,0 +1,59 @@
+import unittest
+
+from investments.date import Date
+from investments.ticker.yahoo_finance_cached_ticker import YahooFinanceCachedTicker
+from tests.investments.ticker.fake_yf_ticker import FakeYfTicker
+
+
+class EmptyRepository:
+    def __init__(self):
+        self.lookups = 0
+        self.rows = {}
+
+    def find(self, **filters):
+        self.lookups += 1
+        return self.rows.get(filters["date"])
+
+
+class TestYahooFinanceCachedTicker(unittest.TestCase):
+    def setUp(self):
+        self.repository = EmptyRepository()
+        self.ticker = YahooFinanceCachedTicker("EUNL.DE", self.repository)
+        self.fake = FakeYfTicker()
+        self.ticker.yf_ticker = self.fake
+
+    def test_getPriceOnUsesPrefetchedHistory(self):
+        dates = [Date(23, 3, 2025), Date(24, 3, 2025), Date(25, 3, 2025)]
+        self.ticker.prefetch(dates)
+
+        self.assertEqual(
+            [self.ticker.getPriceOn(date) for date in dates], [98.91, 99.12, 100.78]
+        )
+        self.assertEqual(self.fake.requests, [("2025-03-21", "2025-03-26")])
+
+    def test_getPriceOnRequestsSingleDayWithoutPrefetch(self):
+        self.assertEqual(self.ticker.getPriceOn(Date(24, 3, 2025)), 99.12)
+        self.assertEqual(self.ticker.getPriceOn(Date(22, 3, 2025)), 98.91)
+        self.assertIsNone(self.ticker.getPriceOn(Date(26, 3, 2025)))
+        self.assertEqual(
+            self.fake.requests,
+            [
+                ("2025-03-24", "2025-03-25"),
+                ("2025-03-21", "2025-03-22"),
+                ("2025-03-26", "2025-03-27"),
+            ],
+        )
+
+    def test_getPriceOnRemembersFoundPrices(self):
+        for _ in range(3):
+            self.assertEqual(self.ticker.getPriceOn(Date(24, 3, 2025)), 99.12)
+
+        self.assertEqual(self.repository.lookups, 1)
+        self.assertEqual(self.fake.requests, [("2025-03-24", "2025-03-25")])
+
+    def test_getPriceOnLooksMissingPricesUpAgain(self):
+        self.assertIsNone(self.ticker.getPriceOn(Date(26, 3, 2025)))
+        self.repository.rows["2025-03-26"] = {"price": 101.0}
+
+        self.assertEqual(self.ticker.getPriceOn(Date(26, 3, 2025)), 101.0)
+        self.assertEqual(self.repository.lookups, 2)
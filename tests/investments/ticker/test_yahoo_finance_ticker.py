@@ -1,7 +1,10 @@
 import unittest
+from unittest import mock
 
+from investments.ticker import yahoo_finance_ticker
 from investments.ticker.yahoo_finance_ticker import YahooFinanceTicker
 from investments.date import Date
+from tests.investments.ticker.fake_yf_ticker import FakeYfTicker
 
 
 class TestYahooFinanceTicker(unittest.TestCase):
@@ -17,5 +20,33 @@ class TestYahooFinanceTicker(unittest.TestCase):
         self.assertEqual(self.ticker.getPriceOn(self.weekend_day_date), 98.91)
 
 
-if __name__ == "__main__":
-    unittest.main()
+class TestYahooFinanceTickerPrefetch(unittest.TestCase):
+    def setUp(self):
+        self.ticker = YahooFinanceTicker("EUNL.DE")
+        self.fake = FakeYfTicker()
+        self.ticker.yf_ticker = self.fake
+
+    def test_getPriceOnUsesPrefetchedHistory(self):
+        self.ticker.prefetchRange(Date(21, 3, 2025), Date(25, 3, 2025))
+
+        self.assertEqual(self.ticker.getPriceOn(Date(25, 3, 2025)), 100.78)
+        self.assertEqual(self.ticker.getPriceOn(Date(23, 3, 2025)), 98.91)
+        self.assertEqual(self.fake.requests, [("2025-03-21", "2025-03-26")])
+
+    def test_yfTickerIsCreatedOnFirstUse(self):
+        with mock.patch.object(yahoo_finance_ticker.yf, "Ticker") as yf_ticker:
+            ticker = YahooFinanceTicker("VUAA.DE")
+            yf_ticker.assert_not_called()
+
+            self.assertIs(ticker.yf_ticker, ticker.yf_ticker)
+            yf_ticker.assert_called_once_with("VUAA.DE")
+
+    def test_prefetchCoversLastWeekDayBeforeEarliestDate(self):
+        self.ticker.prefetch([Date(25, 3, 2025), Date(23, 3, 2025)])
+
+        self.assertEqual(self.ticker.getPriceOn(Date(23, 3, 2025)), 98.91)
+        self.assertEqual(self.fake.requests, [("2025-03-21", "2025-03-26")])
+
+    def test_getPriceOnRaisesForDateWithoutHistory(self):
+        with self.assertRaises(KeyError):
+            self.ticker.getPriceOn(Date(26, 3, 2025))
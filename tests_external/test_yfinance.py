@@ -21,7 +21,3 @@ class TestYFinance(unittest.TestCase):
         price = round(history.loc["2025-03-25", "Close"], 2)
 
         self.assertEqual(price, 100.86)
-
-
-if __name__ == "__main__":
-    unittest.main()